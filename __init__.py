@@ -3,24 +3,54 @@
 """
 Physics Package
 A full open-source source code of how the real world and sound work, based on physics.
+
+Submodules are imported lazily (PEP 562) on first attribute access, so
+`import Physics` stays cheap and only the modules actually used are loaded.
 """
 
-from . import (
-    constants,
-    units,
-    mechanics,
-    sound,
-    waves,
-    thermodynamics,
-    electromagnetism,
-    relativity,
-    quantum,
-    nuclear,
-    optics,
-    fields,
-    astrophysics,
-    particles,
-    chaos,
-    math_tools,
-    philosophy
-)
+import importlib
+
+__all__ = [
+    "constants",
+    "precision",
+    "streaming",
+    "quadrature",
+    "nbody",
+    "circuits",
+    "tracking",
+    "synthesis",
+    "doppler",
+    "spectral",
+    "wave_equation",
+    "raytrace",
+    "schrodinger",
+    "bound_states",
+    "units",
+    "mechanics",
+    "sound",
+    "waves",
+    "thermodynamics",
+    "electromagnetism",
+    "relativity",
+    "quantum",
+    "nuclear",
+    "optics",
+    "fields",
+    "astrophysics",
+    "particles",
+    "chaos",
+    "math_tools",
+    "philosophy",
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
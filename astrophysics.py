@@ -5,36 +5,42 @@ Astrophysics Module
 Implements gravity, orbital mechanics, black holes, and cosmic expansion.
 """
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from Physics.constants import GRAVITATIONAL_CONSTANT, SPEED_OF_LIGHT, HUBBLE_CONSTANT, PI
+from Physics.precision import precise, sqrt
 
-getcontext().prec = 50
 
 # Newton's Law of Gravitation: F = G * m1 * m2 / r²
+@precise
 def gravitational_force(m1: Decimal, m2: Decimal, r: Decimal) -> Decimal:
     """Gravitational force between two masses."""
     return GRAVITATIONAL_CONSTANT * m1 * m2 / r**2
 
 # Orbital velocity: v = √(G * M / r)
+@precise
 def orbital_velocity(mass_central: Decimal, orbital_radius: Decimal) -> Decimal:
     """Velocity of satellite in circular orbit."""
-    return (GRAVITATIONAL_CONSTANT * mass_central / orbital_radius).sqrt()
+    return sqrt(GRAVITATIONAL_CONSTANT * mass_central / orbital_radius)
 
 # Escape velocity: v = √(2 * G * M / r)
+@precise
 def escape_velocity(mass: Decimal, radius: Decimal) -> Decimal:
-    return (Decimal("2") * GRAVITATIONAL_CONSTANT * mass / radius).sqrt()
+    return sqrt(Decimal("2") * GRAVITATIONAL_CONSTANT * mass / radius)
 
 # Kepler's Third Law: T² = (4π² * r³) / (G * M)
+@precise
 def orbital_period(mass_central: Decimal, radius: Decimal) -> Decimal:
     numerator = Decimal("4") * PI**2 * radius**3
     denominator = GRAVITATIONAL_CONSTANT * mass_central
-    return (numerator / denominator).sqrt()
+    return sqrt(numerator / denominator)
 
 # Schwarzschild radius: R = 2GM / c²
+@precise
 def schwarzschild_radius(mass: Decimal) -> Decimal:
     return Decimal("2") * GRAVITATIONAL_CONSTANT * mass / SPEED_OF_LIGHT**2
 
 # Hubble's Law: v = H₀ * d
+@precise
 def recessional_velocity(distance_mpc: Decimal) -> Decimal:
     """Recessional velocity in m/s for a given distance in Megaparsecs."""
     return HUBBLE_CONSTANT * distance_mpc
@@ -0,0 +1,75 @@
+# Physics/benchmarks/bench_import.py
+
+"""
+Import-Time Benchmark
+Measures the cold-start cost of `import Physics` (and of the modules a CLI worker
+typically touches) in a fresh interpreter, and fails if it exceeds a budget.
+A `python -X importtime` breakdown of the slowest modules is printed alongside.
+Run with: python -m Physics.benchmarks.bench_import [--budget-ms 50]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Cold-start budget per scenario (milliseconds, best of REPEATS fresh interpreters).
+DEFAULT_BUDGET_MS = 50.0
+REPEATS = 5
+
+SCENARIOS = {
+    "package": "import Physics",
+    "cli-worker": "import Physics; Physics.mechanics; Physics.units",
+}
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed * 1000, sorted(m for m in sys.modules if m.startswith("Physics."))]))
+"""
+
+
+def cold_start(statement: str) -> Tuple[float, List[str]]:
+    """Run `statement` in a fresh interpreter; return (milliseconds, Physics submodules loaded)."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        capture_output=True, text=True, check=True,
+    )
+    elapsed_ms, modules = json.loads(result.stdout)
+    return elapsed_ms, modules
+
+
+def slowest_imports(statement: str, top: int = 5) -> List[Tuple[str, int]]:
+    """Self import time (µs) of the slowest modules reported by `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us)))
+    return sorted(rows, key=lambda row: -row[1])[:top]
+
+
+def run(budget_ms: float = DEFAULT_BUDGET_MS) -> bool:
+    ok = True
+    for label, statement in SCENARIOS.items():
+        cost, modules = min(cold_start(statement) for _ in range(REPEATS))
+        status = "ok" if cost <= budget_ms else "OVER BUDGET"
+        print(f"{label:<12} {cost:8.2f} ms  [{status}]  loaded: {', '.join(modules) or '-'}")
+        for name, self_us in slowest_imports(statement):
+            print(f"{'':<14}{self_us / 1000:8.2f} ms  {name}")
+        ok = ok and cost <= budget_ms
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Physics import-time benchmark")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    sys.exit(0 if run(parser.parse_args().budget_ms) else 1)
@@ -0,0 +1,48 @@
+# Physics/benchmarks/bench_matmul.py
+
+"""
+Matrix Multiply Benchmark
+Times math_tools.matrix_multiply on each path over a range of sizes to show the crossover points:
+the original triple loop, the blocked exact path (Decimal and float entries) and the BLAS path.
+Run with: python -m Physics.benchmarks.bench_matmul
+"""
+
+import random
+import time
+from decimal import Decimal
+
+from Physics.math_tools import matrix_multiply
+
+SIZES = (4, 8, 16, 32, 64, 128, 256, 500)
+NAIVE_LIMIT = 128  # the reference triple loop is too slow beyond this
+
+
+def _naive(A, B):
+    return [[sum(A[i][k] * B[k][j] for k in range(len(B))) for j in range(len(B[0]))] for i in range(len(A))]
+
+
+def _best_of(fn, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run() -> None:
+    rng = random.Random(0)
+    print(f"{'n':>5} {'naive Decimal':>14} {'exact Decimal':>14} {'exact float':>12} {'blas float':>11}")
+    for n in SIZES:
+        F = [[rng.random() for _ in range(n)] for _ in range(n)]
+        D = [[Decimal(v) for v in row] for row in F]
+        repeats = 3 if n <= 128 else 1
+        naive = _best_of(lambda: _naive(D, D), repeats) if n <= NAIVE_LIMIT else float("nan")
+        exact_dec = _best_of(lambda: matrix_multiply(D, D, method="exact"), repeats)
+        exact_float = _best_of(lambda: matrix_multiply(F, F, method="exact"), repeats)
+        blas = _best_of(lambda: matrix_multiply(F, F, method="blas"), repeats)
+        print(f"{n:>5} {naive:>14.5f} {exact_dec:>14.5f} {exact_float:>12.5f} {blas:>11.5f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,52 @@
+# Physics/benchmarks/bench_mechanics.py
+
+"""
+Mechanics Benchmark
+Compares the Decimal scalar path against the float64 array path on 10^6 elements.
+Run with: python -m Physics.benchmarks.bench_mechanics
+"""
+
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from Physics.mechanics import kinetic_energy, gravitational_force
+
+N = 10 ** 6
+
+
+def _timed(label: str, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:10.4f} s")
+    return elapsed
+
+
+def run(n: int = N) -> None:
+    rng = np.random.default_rng(0)
+    masses = rng.uniform(1.0, 100.0, n)
+    speeds = rng.uniform(0.0, 50.0, n)
+    distances = rng.uniform(1.0, 1e3, n)
+
+    dec_masses = [Decimal(str(m)) for m in masses]
+    dec_speeds = [Decimal(str(v)) for v in speeds]
+    dec_distances = [Decimal(str(r)) for r in distances]
+
+    print(f"n = {n}")
+    t_dec = _timed("kinetic_energy (Decimal loop)",
+                   lambda: [kinetic_energy(m, v) for m, v in zip(dec_masses, dec_speeds)])
+    t_arr = _timed("kinetic_energy (float64 array)",
+                   lambda: kinetic_energy(masses, speeds))
+    print(f"{'speedup':<40} {t_dec / t_arr:10.1f} x")
+
+    t_dec = _timed("gravitational_force (Decimal loop)",
+                   lambda: [gravitational_force(m, m, r) for m, r in zip(dec_masses, dec_distances)])
+    t_arr = _timed("gravitational_force (float64 array)",
+                   lambda: gravitational_force(masses, masses, distances))
+    print(f"{'speedup':<40} {t_dec / t_arr:10.1f} x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,160 @@
+# Physics/bound_states.py
+
+"""
+Bound States Module
+Energy levels and eigenfunctions of -(ħ²/2m)ψ'' + Vψ = Eψ for arbitrary 1D and radial
+potentials, generalising the closed form of quantum.hydrogen_energy_level.
+
+The Hamiltonian is discretized with a 3-point (order=2) or 5-point (order=4) stencil into a
+sparse banded symmetric matrix, and only the lowest k eigenpairs are extracted with
+shift-invert Lanczos (scipy.sparse.linalg.eigsh), avoiding a dense O(N³) diagonalization.
+Units are SI by default (electron mass, ħ from constants).
+"""
+
+from typing import Callable, Tuple, Union
+
+import numpy as np
+from scipy.sparse import diags
+from scipy.sparse.linalg import eigsh
+
+from Physics.constants import COULOMB_CONSTANT, ELECTRON_MASS, ELEMENTARY_CHARGE, REDUCED_PLANCK
+
+_STENCILS = {
+    2: (np.array([1.0, -2.0, 1.0]), 1.0),
+    4: (np.array([-1.0, 16.0, -30.0, 16.0, -1.0]), 12.0),
+}
+_COARSE_POINTS = 1000           # grid size of the pre-solve that places the default shift
+BOHR_RADIUS = float(REDUCED_PLANCK ** 2 / (ELECTRON_MASS * COULOMB_CONSTANT * ELEMENTARY_CHARGE ** 2))  # m
+
+Potential = Union[np.ndarray, Callable[[np.ndarray], np.ndarray]]
+
+
+def hamiltonian(potential: np.ndarray, spacing: float, mass: float = float(ELECTRON_MASS),
+                hbar: float = float(REDUCED_PLANCK), order: int = 4, origin_parity: int = 0):
+    """
+    Sparse Hamiltonian H = -(ħ²/2m) D² + diag(V) on N equally spaced interior points with ψ = 0 beyond both ends.
+    origin_parity: for a radial problem the point before the grid is the origin, and the 5-point stencil reaches
+    one ghost point beyond it, u(-h) = parity·u(h): -1 for odd u (even l), +1 for even u (odd l), 0 for ψ = 0.
+    """
+    if order not in _STENCILS:
+        raise ValueError(f"order must be one of {tuple(_STENCILS)}, not {order!r}")
+    potential = np.asarray(potential, dtype=np.float64)
+    n = len(potential)
+    weights, denominator = _STENCILS[order]
+    half = len(weights) // 2
+    scale = -hbar * hbar / (2 * mass * spacing * spacing * denominator)
+    offsets = list(range(-half, half + 1))
+    bands = [np.full(n - abs(k), scale * w) for k, w in zip(offsets, weights)]
+    bands[half] = bands[half] + potential
+    if origin_parity and half == 2:
+        bands[half][0] += origin_parity * scale * weights[0]  # fold the ghost u(-h) = ±u(h) onto the diagonal
+    return diags(bands, offsets, format="csc")
+
+
+def lowest_eigenpairs(matrix, k: int, spacing: float, sigma: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The k eigenvalues nearest `sigma` (pick sigma just below the ground state) by shift-invert Lanczos,
+    ascending, with eigenvectors (N, k) normalized so Σ|ψ|²·h = 1 and positive near the first point.
+    """
+    values, vectors = eigsh(matrix, k=k, sigma=sigma, which="LM")
+    order = np.argsort(values)
+    values, vectors = values[order], vectors[:, order]
+    vectors /= np.sqrt(spacing)
+    first = np.argmax(np.abs(vectors) > 1e-6 * np.abs(vectors).max(axis=0), axis=0)
+    vectors *= np.sign(vectors[first, np.arange(k)])
+    return values, vectors
+
+
+def _default_sigma(v: np.ndarray, spacing: float, mass: float, hbar: float, order: int, origin_parity: int = 0) -> float:
+    """
+    Shift just below the ground state, estimated on a coarsened grid: shift-invert converges in a few
+    iterations there, whereas min(V) can sit far below the spectrum (e.g. -Ze²/r at the first point).
+    """
+    step = max(1, len(v) // _COARSE_POINTS)
+    coarse = v[step - 1::step] if origin_parity else v[::step]
+    matrix = hamiltonian(coarse, spacing * step, mass, hbar, order, origin_parity)
+    ground = float(eigsh(matrix, k=1, sigma=float(coarse.min()), which="LM")[0][0])
+    return ground - 0.1 * abs(ground) - 1e-12 * abs(float(coarse.min()))
+
+
+def bound_states_1d(x_min: float, x_max: float, points: int, potential: Potential, k: int = 5,
+                    mass: float = float(ELECTRON_MASS), hbar: float = float(REDUCED_PLANCK), order: int = 4,
+                    sigma: float = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lowest k bound states of V on [x_min, x_max] with hard walls at the ends.
+    Returns (energies (k,), wave functions (points, k), x (points,)).
+    """
+    x = np.linspace(x_min, x_max, points + 2)[1:-1]
+    spacing = x[1] - x[0]
+    v = potential(x) if callable(potential) else np.asarray(potential, dtype=np.float64)
+    sigma = _default_sigma(v, spacing, mass, hbar, order) if sigma is None else sigma
+    energies, states = lowest_eigenpairs(hamiltonian(v, spacing, mass, hbar, order), k, spacing, sigma)
+    return energies, states, x
+
+
+def radial_bound_states(potential: Potential, l: int = 0, k: int = 5, r_max: float = 60 * BOHR_RADIUS,
+                        points: int = 20000, mass: float = float(ELECTRON_MASS), hbar: float = float(REDUCED_PLANCK),
+                        order: int = 4, sigma: float = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lowest k states of angular momentum l in a central potential V(r), solving for u(r) = r·R(r) with
+    the centrifugal term ħ²l(l+1)/(2mr²) and u(0) = u(r_max) = 0. Near the origin u ∝ r^(l+1), so u is odd
+    in r for even l and even for odd l; the 5-point stencil's ghost point uses that parity.
+    Returns (energies (k,), u (points, k), r (points,)).
+    """
+    r = np.arange(1, points + 1) * (r_max / (points + 1))
+    spacing = r[0]
+    v = potential(r) if callable(potential) else np.asarray(potential, dtype=np.float64)
+    v = v + hbar * hbar * l * (l + 1) / (2 * mass * r * r)
+    parity = -1 if l % 2 == 0 else 1
+    sigma = _default_sigma(v, spacing, mass, hbar, order, parity) if sigma is None else sigma
+    matrix = hamiltonian(v, spacing, mass, hbar, order, parity)
+    energies, states = lowest_eigenpairs(matrix, k, spacing, sigma)
+    return energies, states, r
+
+
+def coulomb_potential(z: int = 1) -> Callable[[np.ndarray], np.ndarray]:
+    """V(r) = -Z·k·e²/r for a nucleus of charge Ze (J)."""
+    strength = z * float(COULOMB_CONSTANT * ELEMENTARY_CHARGE ** 2)
+    return lambda r: -strength / r
+
+
+def hydrogen_levels(n_max: int = 3, l: int = 0, **options) -> np.ndarray:
+    """Numerical hydrogen energies (J) for n = l+1 … n_max from the radial Coulomb problem."""
+    return radial_bound_states(coulomb_potential(), l=l, k=n_max - l, **options)[0]
+
+
+def verify_hydrogen(n_max: int = 3, rtol: float = 2e-3) -> float:
+    """
+    Regression check: the Coulomb solver must reproduce quantum.hydrogen_energy_level for n = 1 … n_max
+    (s states, and p states for n ≥ 2) within `rtol`, which covers the rounded 13.6 eV there.
+    Returns the largest relative deviation; raises AssertionError if it exceeds rtol.
+    """
+    from Physics.quantum import hydrogen_energy_level
+
+    expected = np.array([float(hydrogen_energy_level(n)) for n in range(1, n_max + 1)])
+    deviation = 0.0
+    for l in (0, 1):
+        computed = hydrogen_levels(n_max, l)
+        deviation = max(deviation, float(np.max(np.abs(computed / expected[l:] - 1))))
+    if deviation > rtol:
+        raise AssertionError(
+            f"hydrogen levels deviate from quantum.hydrogen_energy_level by {deviation:.2e} > {rtol:.0e}")
+    return deviation
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Physics.quantum import hydrogen_energy_level
+
+    eV = float(ELEMENTARY_CHARGE)
+    start = time.perf_counter()
+    levels = hydrogen_levels(4)
+    elapsed = time.perf_counter() - start
+    for n, energy in enumerate(levels, start=1):
+        print(f"n={n}: {energy / eV:.5f} eV (quantum.hydrogen_energy_level: {float(hydrogen_energy_level(n)) / eV:.5f} eV)")
+    print(f"20000-point radial solve: {elapsed:.2f} s; regression deviation {verify_hydrogen():.1e}")
+
+    # Harmonic oscillator (ħ = m = ω = 1): E = n + 1/2
+    energies, _, _ = bound_states_1d(-10, 10, 4000, lambda x: 0.5 * x * x, k=5, mass=1.0, hbar=1.0)
+    print("Harmonic oscillator:", np.round(energies, 6))
@@ -5,12 +5,104 @@ Chaos Module
 Models deterministic chaos and nonlinear systems: Lorenz system, logistic map.
 """
 
-from typing import List, Tuple
-from decimal import Decimal, getcontext
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator, List, Tuple
+from decimal import Decimal
+from Physics.precision import precise
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the float/array paths
+    np = None
+
+LORENZ_METHODS = ("euler", "rk4", "rk45")
+
+# Dormand–Prince 5(4) tableau: stage coefficients, 5th-order weights, and (5th - 4th) error weights
+_DP_A = (
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_E = (
+    71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40,
+)
+
+
+def _lorenz_rhs(x, y, z, sigma, rho, beta):
+    """Lorenz vector field; works on Decimals, floats or NumPy arrays alike."""
+    return sigma * (y - x), x * (rho - z) - y, x * y - beta * z
+
+
+def _rk4_step(x, y, z, sigma, rho, beta, dt):
+    """Classical 4th-order Runge–Kutta step for the Lorenz system."""
+    half = dt / 2
+    k1 = _lorenz_rhs(x, y, z, sigma, rho, beta)
+    k2 = _lorenz_rhs(x + half * k1[0], y + half * k1[1], z + half * k1[2], sigma, rho, beta)
+    k3 = _lorenz_rhs(x + half * k2[0], y + half * k2[1], z + half * k2[2], sigma, rho, beta)
+    k4 = _lorenz_rhs(x + dt * k3[0], y + dt * k3[1], z + dt * k3[2], sigma, rho, beta)
+    sixth = dt / 6
+    return (
+        x + sixth * (k1[0] + 2 * k2[0] + 2 * k3[0] + k4[0]),
+        y + sixth * (k1[1] + 2 * k2[1] + 2 * k3[1] + k4[1]),
+        z + sixth * (k1[2] + 2 * k2[2] + 2 * k3[2] + k4[2]),
+    )
+
+
+def _dp45_step(x, y, z, k1, sigma, rho, beta, h):
+    """
+    One Dormand–Prince step of size h (float scalars).
+    Returns the 5th-order state, its derivative (FSAL: next step's k1) and the error estimate per component.
+    """
+    k = [k1]
+    for row in _DP_A:
+        sx, sy, sz = x, y, z
+        for a, ki in zip(row, k):
+            if a:
+                ha = h * a
+                sx += ha * ki[0]
+                sy += ha * ki[1]
+                sz += ha * ki[2]
+        k.append(_lorenz_rhs(sx, sy, sz, sigma, rho, beta))
+    ex = ey = ez = 0.0
+    for e, ki in zip(_DP_E, k):
+        if e:
+            he = h * e
+            ex += he * ki[0]
+            ey += he * ki[1]
+            ez += he * ki[2]
+    return (sx, sy, sz), k[-1], (ex, ey, ez)
+
+
+def _dp45_advance(x, y, z, k1, h, t_span, sigma, rho, beta, rtol, atol):
+    """
+    Integrate adaptively over an interval of length t_span, landing exactly on its end.
+    Returns the new state, its derivative and the step size to try next.
+    """
+    t = 0.0
+    while t < t_span:
+        h = min(h, t_span - t)
+        (nx, ny, nz), nk, err = _dp45_step(x, y, z, k1, sigma, rho, beta, h)
+        scale = (
+            atol + rtol * max(abs(x), abs(nx)),
+            atol + rtol * max(abs(y), abs(ny)),
+            atol + rtol * max(abs(z), abs(nz)),
+        )
+        err_norm = max(abs(e) / s for e, s in zip(err, scale))
+        if err_norm <= 1.0:
+            t += h
+            x, y, z, k1 = nx, ny, nz, nk
+        # Standard step-size controller with safety factor 0.9, growth clamped to [0.2, 5]
+        factor = 5.0 if err_norm == 0.0 else min(5.0, max(0.2, 0.9 * err_norm ** -0.2))
+        h *= factor
+    return x, y, z, k1, h
 
-getcontext().prec = 50
 
 # Lorenz system: dx/dt = σ(y - x), dy/dt = x(ρ - z) - y, dz/dt = xy - βz
+@precise
 def lorenz_step(x: Decimal, y: Decimal, z: Decimal, sigma: Decimal, rho: Decimal, beta: Decimal, dt: Decimal) -> Tuple[Decimal, Decimal, Decimal]:
     dx = sigma * (y - x)
     dy = x * (rho - z) - y
@@ -20,15 +112,156 @@ def lorenz_step(x: Decimal, y: Decimal, z: Decimal, sigma: Decimal, rho: Decimal
     z_new = z + dz * dt
     return x_new, y_new, z_new
 
-def lorenz_trajectory(x0: Decimal, y0: Decimal, z0: Decimal, sigma: Decimal, rho: Decimal, beta: Decimal, dt: Decimal, steps: int) -> List[Tuple[Decimal, Decimal, Decimal]]:
+@precise
+def lorenz_rk4_step(x: Decimal, y: Decimal, z: Decimal, sigma: Decimal, rho: Decimal, beta: Decimal, dt: Decimal) -> Tuple[Decimal, Decimal, Decimal]:
+    """Advance the Lorenz system one step with classical 4th-order Runge–Kutta."""
+    return _rk4_step(x, y, z, sigma, rho, beta, dt)
+
+@precise
+def lorenz_trajectory(x0: Decimal, y0: Decimal, z0: Decimal, sigma: Decimal, rho: Decimal, beta: Decimal, dt: Decimal, steps: int, method: str = "euler") -> List[Tuple[Decimal, Decimal, Decimal]]:
+    """
+    Decimal Lorenz trajectory (list of `steps` points after x0, y0, z0).
+    method: "euler" (forward Euler) or "rk4". For "rk45" use lorenz_trajectory_array.
+    """
+    if method == "euler":
+        step = lorenz_step
+    elif method == "rk4":
+        step = _rk4_step
+    else:
+        raise ValueError(f"Decimal path supports 'euler' and 'rk4', not {method!r}")
     trajectory = []
     x, y, z = x0, y0, z0
     for _ in range(steps):
-        x, y, z = lorenz_step(x, y, z, sigma, rho, beta, dt)
+        x, y, z = step(x, y, z, sigma, rho, beta, dt)
         trajectory.append((x, y, z))
     return trajectory
 
+def lorenz_trajectory_array(x0: float, y0: float, z0: float, sigma: float, rho: float, beta: float, dt: float, steps: int,
+                            method: str = "rk4", rtol: float = 1e-6, atol: float = 1e-9) -> "np.ndarray":
+    """
+    Float64 Lorenz trajectory sampled every dt, returned as a preallocated (steps, 3) ndarray.
+    method: "euler", "rk4" (fixed step) or "rk45" (adaptive Dormand–Prince with rtol/atol error
+    control; internal steps are chosen freely but always land on the dt output grid).
+    """
+    if method not in LORENZ_METHODS:
+        raise ValueError(f"method must be one of {LORENZ_METHODS}, not {method!r}")
+    out = np.empty((steps, 3), dtype=np.float64)
+    _lorenz_fill(out, float(x0), float(y0), float(z0), float(sigma), float(rho), float(beta), float(dt),
+                 method, rtol, atol, float(dt))
+    return out
+
+def _lorenz_fill(out, x, y, z, sigma, rho, beta, dt, method, rtol, atol, h):
+    """Fill the (rows, 3) array out in place; returns the final (x, y, z, h) so runs can be continued."""
+    if method == "rk45":
+        k1 = _lorenz_rhs(x, y, z, sigma, rho, beta)
+        for i in range(len(out)):
+            x, y, z, k1, h = _dp45_advance(x, y, z, k1, h, dt, sigma, rho, beta, rtol, atol)
+            out[i] = x, y, z
+        return x, y, z, h
+    for i in range(len(out)):
+        if method == "rk4":
+            x, y, z = _rk4_step(x, y, z, sigma, rho, beta, dt)
+        else:
+            dx, dy, dz = _lorenz_rhs(x, y, z, sigma, rho, beta)
+            x, y, z = x + dx * dt, y + dy * dt, z + dz * dt
+        out[i] = x, y, z
+    return x, y, z, h
+
+def _lorenz_stream(x, y, z, sigma, rho, beta, dt, steps, chunk_size, method, rtol, atol, h):
+    if method not in LORENZ_METHODS:
+        raise ValueError(f"method must be one of {LORENZ_METHODS}, not {method!r}")
+    x, y, z, sigma, rho, beta, dt, h = map(float, (x, y, z, sigma, rho, beta, dt, h))
+    for start in range(0, steps, chunk_size):
+        chunk = np.empty((min(chunk_size, steps - start), 3))
+        x, y, z, h = _lorenz_fill(chunk, x, y, z, sigma, rho, beta, dt, method, rtol, atol, h)
+        yield chunk, (x, y, z, h)
+
+def lorenz_chunks(x0: float, y0: float, z0: float, sigma: float, rho: float, beta: float, dt: float, steps: int,
+                  chunk_size: int = 65536, method: str = "rk4", rtol: float = 1e-6, atol: float = 1e-9) -> Iterator["np.ndarray"]:
+    """Streaming lorenz_trajectory_array: yields the trajectory as (chunk_size, 3) arrays (last one shorter)."""
+    for chunk, _ in _lorenz_stream(x0, y0, z0, sigma, rho, beta, dt, steps, chunk_size, method, rtol, atol, dt):
+        yield chunk
+
+def lorenz_to_npy(path: str, x0: float, y0: float, z0: float, sigma: float, rho: float, beta: float, dt: float,
+                  steps: int, chunk_size: int = 65536, checkpoint_every: int = 16, method: str = "rk4",
+                  rtol: float = 1e-6, atol: float = 1e-9) -> "np.ndarray":
+    """
+    Stream a (steps, 3) Lorenz trajectory into a memory-mapped .npy file at path.
+    A checkpoint is saved every `checkpoint_every` chunks; calling again with the same arguments after
+    the job was killed resumes from the last checkpoint instead of step 0 (different arguments raise ValueError).
+    Returns the file memory-mapped read-only.
+    """
+    from Physics.streaming import NpyStreamWriter
+
+    params = {"x0": x0, "y0": y0, "z0": z0, "sigma": sigma, "rho": rho, "beta": beta, "dt": dt,
+              "method": method, "rtol": rtol, "atol": atol, "chunk_size": chunk_size}
+    writer = NpyStreamWriter(path, (steps, 3), params=params)
+    x, y, z, h = writer.state if writer.resumed else (x0, y0, z0, dt)
+    stream = _lorenz_stream(x, y, z, sigma, rho, beta, dt, steps - writer.rows, chunk_size, method, rtol, atol, h)
+    for count, (chunk, state) in enumerate(stream, start=1):
+        writer.append(chunk)
+        if count % checkpoint_every == 0:
+            writer.checkpoint(state)
+    return writer.close()
+
+def _split_across_processes(func, states: "np.ndarray", workers: int, chunk_size: int) -> "np.ndarray":
+    """Apply func to row-chunks of states in a process pool and concatenate the results."""
+    chunks = [states[i:i + chunk_size] for i in range(0, len(states), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return np.concatenate(list(pool.map(func, chunks)))
+
+def lorenz_ensemble(states: "np.ndarray", sigma: float, rho: float, beta: float, dt: float, steps: int,
+                    workers: int = 1, chunk_size: int = 100_000) -> "np.ndarray":
+    """
+    Advance N initial conditions in lockstep with RK4; states is an (N, 3) array.
+    Returns the (N, 3) final states. With workers > 1, chunks of chunk_size rows run in a process pool.
+    """
+    states = np.array(states, dtype=np.float64).reshape(-1, 3)
+    if workers > 1 and len(states) > chunk_size:
+        func = partial(lorenz_ensemble, sigma=sigma, rho=rho, beta=beta, dt=dt, steps=steps)
+        return _split_across_processes(func, states, workers, chunk_size)
+    x, y, z = states[:, 0], states[:, 1], states[:, 2]
+    for _ in range(steps):
+        x, y, z = _rk4_step(x, y, z, sigma, rho, beta, dt)
+    return np.stack((x, y, z), axis=1)
+
+def lorenz_lyapunov(states: "np.ndarray", sigma: float, rho: float, beta: float, dt: float, steps: int,
+                    renormalize_every: int = 10, separation: float = 1e-8, transient: int = 0,
+                    workers: int = 1, chunk_size: int = 100_000) -> "np.ndarray":
+    """
+    Largest Lyapunov exponent for each of N initial conditions (Benettin method).
+    Each state is paired with a neighbour displaced by `separation`; both are advanced with RK4 and,
+    every `renormalize_every` steps, the log stretching is accumulated and the neighbour pulled back
+    to distance `separation` along the current separation vector.
+    The first `transient` steps settle onto the attractor and are not counted. Returns an (N,) array.
+    """
+    states = np.array(states, dtype=np.float64).reshape(-1, 3)
+    if workers > 1 and len(states) > chunk_size:
+        func = partial(lorenz_lyapunov, sigma=sigma, rho=rho, beta=beta, dt=dt, steps=steps,
+                       renormalize_every=renormalize_every, separation=separation, transient=transient)
+        return _split_across_processes(func, states, workers, chunk_size)
+    if transient:
+        states = lorenz_ensemble(states, sigma, rho, beta, dt, transient)
+    n = len(states)
+    # Reference trajectories in rows [:n], displaced neighbours in rows [n:]
+    pair = np.concatenate((states, states + separation / np.sqrt(3.0)))
+    x, y, z = pair[:, 0], pair[:, 1], pair[:, 2]
+    log_sum = np.zeros(n)
+    for step in range(1, steps + 1):
+        x, y, z = _rk4_step(x, y, z, sigma, rho, beta, dt)
+        if step % renormalize_every and step != steps:
+            continue
+        delta = np.stack((x[n:] - x[:n], y[n:] - y[:n], z[n:] - z[:n]))
+        distance = np.sqrt((delta ** 2).sum(axis=0))
+        log_sum += np.log(distance / separation)
+        delta *= separation / distance
+        x = np.concatenate((x[:n], x[:n] + delta[0]))
+        y = np.concatenate((y[:n], y[:n] + delta[1]))
+        z = np.concatenate((z[:n], z[:n] + delta[2]))
+    return log_sum / (steps * dt)
+
 # Logistic map: x_{n+1} = r * x_n * (1 - x_n)
+@precise
 def logistic_map(r: Decimal, x0: Decimal, steps: int) -> List[Decimal]:
     results = []
     x = x0
@@ -37,6 +270,96 @@ def logistic_map(r: Decimal, x0: Decimal, steps: int) -> List[Decimal]:
         results.append(x)
     return results
 
+def _logistic_iterate(r: "np.ndarray", x: "np.ndarray", tmp: "np.ndarray") -> None:
+    """x <- r x (1 - x) in place for a whole r-grid, using tmp as scratch (no allocation)."""
+    np.subtract(1.0, x, out=tmp)
+    tmp *= x
+    np.multiply(r, tmp, out=x)
+
+def _logistic_settle(r_values, x0: float, transient: int) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    r = np.asarray(r_values, dtype=np.float64).ravel()
+    x = np.full_like(r, float(x0))
+    tmp = np.empty_like(r)
+    for _ in range(transient):
+        _logistic_iterate(r, x, tmp)
+    return r, x, tmp
+
+def logistic_bifurcation(r_values, x0: float = 0.5, transient: int = 1000, keep: int = 1000,
+                         chunk_size: int = 256) -> Iterator["np.ndarray"]:
+    """
+    Bifurcation-diagram engine: iterate the logistic map over a whole r-grid at once.
+    After discarding `transient` iterations, yields the `keep` retained attractor points in
+    (rows, len(r_values)) chunks of at most chunk_size rows, so memory stays at chunk_size × R.
+    """
+    r, x, tmp = _logistic_settle(r_values, x0, transient)
+    remaining = keep
+    while remaining > 0:
+        rows = min(chunk_size, remaining)
+        chunk = np.empty((rows, len(r)))
+        for i in range(rows):
+            _logistic_iterate(r, x, tmp)
+            chunk[i] = x
+        remaining -= rows
+        yield chunk
+
+def logistic_lyapunov(r_values, x0: float = 0.5, transient: int = 1000, iterations: int = 10000) -> "np.ndarray":
+    """
+    Lyapunov exponent of the logistic map for every r: mean of ln|r (1 - 2x)| along the orbit.
+    Superstable orbits (x = 1/2 exactly) give -inf.
+    """
+    r, x, tmp = _logistic_settle(r_values, x0, transient)
+    total = np.zeros_like(r)
+    with np.errstate(divide="ignore"):
+        for _ in range(iterations):
+            _logistic_iterate(r, x, tmp)
+            np.multiply(x, -2.0, out=tmp)
+            tmp += 1.0
+            tmp *= r
+            np.abs(tmp, out=tmp)
+            total += np.log(tmp)
+    return total / iterations
+
+def logistic_period(r_values, x0: float = 0.5, transient: int = 10000, max_period: int = 64,
+                    tol: float = 1e-9) -> "np.ndarray":
+    """
+    Period of the attracting orbit for every r (smallest p with |x_{n+p} - x_n| < tol after the
+    transient). Returns an int array with 0 where no period up to max_period was found (chaos).
+    """
+    r, x, tmp = _logistic_settle(r_values, x0, transient)
+    reference = x.copy()
+    period = np.zeros(len(r), dtype=np.int64)
+    for p in range(1, max_period + 1):
+        _logistic_iterate(r, x, tmp)
+        found = (period == 0) & (np.abs(x - reference) < tol)
+        period[found] = p
+    return period
+
+def logistic_chunks(r: float, x0: float, steps: int, chunk_size: int = 65536) -> Iterator["np.ndarray"]:
+    """Streaming float64 logistic_map: yields the orbit in arrays of chunk_size values (last one shorter)."""
+    r, x = float(r), float(x0)
+    for start in range(0, steps, chunk_size):
+        chunk = np.empty(min(chunk_size, steps - start))
+        for i in range(len(chunk)):
+            x = r * x * (1.0 - x)
+            chunk[i] = x
+        yield chunk
+
+def logistic_to_npy(path: str, r: float, x0: float, steps: int, chunk_size: int = 65536,
+                    checkpoint_every: int = 16) -> "np.ndarray":
+    """
+    Stream a logistic-map orbit into a memory-mapped .npy file, resuming from the last checkpoint if any
+    (written with the same r, x0 and chunk_size; otherwise ValueError).
+    """
+    from Physics.streaming import NpyStreamWriter
+
+    writer = NpyStreamWriter(path, (steps,), params={"r": r, "x0": x0, "chunk_size": chunk_size})
+    x = writer.state[0] if writer.resumed else x0
+    for count, chunk in enumerate(logistic_chunks(r, x, steps - writer.rows, chunk_size), start=1):
+        writer.append(chunk)
+        if count % checkpoint_every == 0:
+            writer.checkpoint((chunk[-1],))
+    return writer.close()
+
 # Example usage
 if __name__ == "__main__":
     sigma = Decimal("10")
@@ -50,6 +373,13 @@ if __name__ == "__main__":
     for point in traj[:5]:
         print(point)
 
+    if np is not None:
+        print("\nLorenz RK45 (float64, last point):", lorenz_trajectory_array(1, 1, 1, 10, 28, 8 / 3, 0.01, steps, method="rk45")[-1])
+        ensemble = np.random.default_rng(0).uniform(-10, 10, (4, 3)) + [0, 0, 25]
+        r_grid = np.array([2.8, 3.2, 3.5, 3.7])
+        print("Logistic periods:", logistic_period(r_grid), "Lyapunov:", logistic_lyapunov(r_grid))
+        print("Largest Lyapunov exponents:", lorenz_lyapunov(ensemble, 10, 28, 8 / 3, 0.01, 5000, transient=1000))
+
     print("\nLogistic Map (r=3.7, x0=0.5):")
     logistic = logistic_map(Decimal("3.7"), Decimal("0.5"), 20)
     for i, x in enumerate(logistic):
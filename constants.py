@@ -5,15 +5,11 @@ Universal Physical Constants
 These values are based on CODATA 2018 recommended values.
 """
 
-from decimal import Decimal, getcontext
-
-# Set precision for Decimal operations
-getcontext().prec = 50
+from decimal import Decimal, localcontext
 
 # Fundamental constants
 SPEED_OF_LIGHT = Decimal("299792458")             # m/s
 PLANCK_CONSTANT = Decimal("6.62607015e-34")        # J·s
-REDUCED_PLANCK = PLANCK_CONSTANT / (2 * Decimal("3.141592653589793"))
 GRAVITATIONAL_CONSTANT = Decimal("6.67430e-11")    # m³/kg/s²
 ELEMENTARY_CHARGE = Decimal("1.602176634e-19")     # C
 AVOGADRO_NUMBER = Decimal("6.02214076e23")         # mol⁻¹
@@ -24,8 +20,18 @@ PROTON_MASS = Decimal("1.67262192369e-27")         # kg
 NEUTRON_MASS = Decimal("1.67492749804e-27")        # kg
 PLANETARY_MASS_EARTH = Decimal("5.972e24")         # kg
 PLANETARY_RADIUS_EARTH = Decimal("6371000")        # m
+VACUUM_PERMITTIVITY = Decimal("8.8541878128e-12")  # F/m
+MU_0 = Decimal("1.25663706212e-6")                 # N/A²
+HUBBLE_CONSTANT = Decimal("67.4e3")                # m/s/Mpc (Planck 2018)
+
+# Mathematical constants
+PI = Decimal("3.1415926535897932384626433832795028841971693993751")
 
-# Derived constants
+# Derived constants (evaluated at 50 digits in a local context, caller's context untouched)
+with localcontext() as _ctx:
+    _ctx.prec = 50
+    REDUCED_PLANCK = PLANCK_CONSTANT / (2 * Decimal("3.141592653589793"))
+    COULOMB_CONSTANT = 1 / (4 * PI * VACUUM_PERMITTIVITY)  # N·m²/C²
 LIGHT_YEAR = SPEED_OF_LIGHT * Decimal("31557600")  # meters in one Julian year
 STANDARD_GRAVITY = Decimal("9.80665")              # m/s²
 
@@ -0,0 +1,147 @@
+# Physics/doppler.py
+
+"""
+Doppler Rendering Module
+Renders what an observer hears from a moving sound source, sample by sample, instead of
+the single constant-speed frequency of sound.doppler_effect.
+
+For every output time t the emission time τ solves t - τ = |x_obs(t) - x_src(τ)| / c
+(a contraction for subsonic sources, solved by fixed-point iteration). The source signal
+is read at τ with fractional-delay interpolation and scaled by the spherical-spreading
+amplitude sqrt(I(r) / I(r_ref)) from sound.intensity. Output is produced in chunks and
+can be streamed straight into a WAV file, so long scenes never have to fit in memory.
+"""
+
+import wave
+from typing import Callable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from Physics.sound import SPEED_OF_SOUND_AIR, intensity
+
+Path = Union[Sequence[float], Callable[["np.ndarray"], "np.ndarray"]]  # fixed point or times (n,) -> (n, 3)
+
+INTERPOLATIONS = ("linear", "cubic")
+
+
+def linear_path(start: Sequence[float], velocity: Sequence[float]) -> Callable[[np.ndarray], np.ndarray]:
+    """Straight-line trajectory x(t) = start + velocity · t."""
+    start = np.asarray(start, dtype=np.float64)
+    velocity = np.asarray(velocity, dtype=np.float64)
+    return lambda times: start + times[:, None] * velocity
+
+
+def _positions(path: Path, times: np.ndarray) -> np.ndarray:
+    if callable(path):
+        return np.asarray(path(times), dtype=np.float64).reshape(len(times), 3)
+    return np.broadcast_to(np.asarray(path, dtype=np.float64), (len(times), 3))
+
+
+def emission_times(times: np.ndarray, source_path: Path, observer_path: Path = (0.0, 0.0, 0.0),
+                   speed_of_sound: float = float(SPEED_OF_SOUND_AIR), tolerance: float = 1e-9,
+                   max_iterations: int = 50) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Retarded (emission) times τ and source–observer distances r for an array of reception times,
+    iterating τ ← t - |x_obs(t) - x_src(τ)| / c until every τ moves by less than `tolerance` seconds.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    observer = _positions(observer_path, times)
+    tau = times.copy()
+    for _ in range(max_iterations):
+        distance = np.linalg.norm(observer - _positions(source_path, tau), axis=1)
+        updated = times - distance / speed_of_sound
+        converged = np.abs(updated - tau).max(initial=0.0) < tolerance
+        tau = updated
+        if converged:
+            break
+    return tau, distance
+
+
+def _fractional_read(signal, positions: np.ndarray, interpolation: str) -> np.ndarray:
+    """Signal at fractional sample positions (zero outside the signal), reading only the needed window."""
+    if len(positions) == 0:
+        return np.zeros(0)
+    lo = max(int(np.floor(positions.min())) - 1, 0)
+    hi = min(int(np.floor(positions.max())) + 3, len(signal))
+    window = np.zeros(max(hi - lo, 0) + 4)
+    if hi > lo:
+        window[1:hi - lo + 1] = signal[lo:hi]           # one zero of padding on the left
+    local = positions - lo + 1
+    index = np.floor(local).astype(np.intp)
+    inside = (index >= 1) & (index < len(window) - 2)
+    index = np.clip(index, 1, len(window) - 3)
+    frac = local - index
+    if interpolation == "linear":
+        out = window[index] + frac * (window[index + 1] - window[index])
+    else:
+        # Cubic Lagrange through samples i-1, i, i+1, i+2
+        out = (-frac * (frac - 1) * (frac - 2) / 6 * window[index - 1]
+               + (frac + 1) * (frac - 1) * (frac - 2) / 2 * window[index]
+               - (frac + 1) * frac * (frac - 2) / 2 * window[index + 1]
+               + (frac + 1) * frac * (frac - 1) / 6 * window[index + 2])
+    return np.where(inside, out, 0.0)
+
+
+def render_doppler(signal, sample_rate: int, source_path: Path, observer_path: Path = (0.0, 0.0, 0.0),
+                   duration: Optional[float] = None, speed_of_sound: float = float(SPEED_OF_SOUND_AIR),
+                   reference_distance: float = 1.0, min_distance: float = 0.1, chunk_size: int = 65536,
+                   interpolation: str = "cubic") -> Iterator[np.ndarray]:
+    """
+    Yield the received waveform in chunks of `chunk_size` samples (the last may be shorter).
+
+    `signal` is the source's emitted waveform at `reference_distance` (any sliceable 1D array,
+    e.g. a memory-mapped .npy); t = 0 is its first sample. `duration` defaults to the signal length.
+    Distances below `min_distance` are clamped so a fly-through does not blow up.
+    """
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(f"interpolation must be one of {INTERPOLATIONS}, not {interpolation!r}")
+    total = int(round((len(signal) / sample_rate if duration is None else duration) * sample_rate))
+    reference = intensity(1.0, np.array(reference_distance))
+    for start in range(0, total, chunk_size):
+        times = np.arange(start, min(start + chunk_size, total)) / sample_rate
+        tau, distance = emission_times(times, source_path, observer_path, speed_of_sound,
+                                       tolerance=1e-3 / sample_rate)
+        gain = np.sqrt(intensity(1.0, np.maximum(distance, min_distance)) / reference)
+        yield gain * _fractional_read(signal, tau * sample_rate, interpolation)
+
+
+def doppler_to_wav(path: str, signal, sample_rate: int, source_path: Path, observer_path: Path = (0.0, 0.0, 0.0),
+                   duration: Optional[float] = None, scale: float = 1.0, **options) -> int:
+    """
+    Stream render_doppler into a mono 16-bit PCM WAV file chunk by chunk.
+    Samples are multiplied by `scale` and clipped to [-1, 1]; returns the number of clipped samples.
+    """
+    clipped = 0
+    with wave.open(path, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        for chunk in render_doppler(signal, sample_rate, source_path, observer_path, duration, **options):
+            chunk = chunk * scale
+            clipped += int(np.count_nonzero(np.abs(chunk) > 1.0))
+            out.writeframes((np.clip(chunk, -1.0, 1.0) * 32767).astype("<i2").tobytes())
+    return clipped
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from decimal import Decimal
+    from Physics.sound import doppler_effect
+
+    rate, tone, speed = 48000, 1000.0, 40.0
+    source = np.sin(2 * np.pi * tone * np.arange(20 * rate) / rate)
+    flyover = linear_path((-400.0, 10.0, 0.0), (speed, 0.0, 0.0))  # passes 10 m from the observer at t = 10 s
+
+    heard = np.concatenate(list(render_doppler(source, rate, flyover, duration=18.0)))
+    for label, start, sign in (("approaching", 4, 1), ("receding", 14, -1)):
+        segment = heard[start * rate:(start + 1) * rate]
+        crossings = np.count_nonzero(np.diff(np.signbit(segment)))
+        expected = doppler_effect(Decimal(tone), Decimal(sign * speed), Decimal(0))
+        print(f"{label}: measured {crossings / 2:.0f} Hz, sound.doppler_effect {float(expected):.0f} Hz")
+
+    path = os.path.join(tempfile.mkdtemp(), "flyover.wav")
+    clipped = doppler_to_wav(path, source, rate, flyover, duration=18.0, scale=5.0, chunk_size=16384)
+    with wave.open(path) as f:
+        print("Wrote", path, f.getnframes(), "frames;", clipped, "samples clipped")
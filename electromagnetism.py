@@ -5,58 +5,68 @@ Electromagnetism Module
 Implements electric forces, fields, circuits, and magnetic principles using physical laws.
 """
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from Physics.constants import COULOMB_CONSTANT, ELEMENTARY_CHARGE, VACUUM_PERMITTIVITY
+from Physics.precision import precise
 
-getcontext().prec = 50
 
 # Coulomb's Law: F = k * q1 * q2 / r^2
+@precise
 def electric_force(q1: Decimal, q2: Decimal, distance: Decimal) -> Decimal:
     """Calculate electric force between two point charges (N)."""
     return COULOMB_CONSTANT * q1 * q2 / (distance ** 2)
 
 
 # Electric field: E = F / q = k * Q / r^2
+@precise
 def electric_field(source_charge: Decimal, distance: Decimal) -> Decimal:
     """Calculate electric field (N/C)."""
     return COULOMB_CONSTANT * source_charge / (distance ** 2)
 
 
 # Electric potential energy: U = k * q1 * q2 / r
+@precise
 def electric_potential_energy(q1: Decimal, q2: Decimal, distance: Decimal) -> Decimal:
     """Calculate electric potential energy (J)."""
     return COULOMB_CONSTANT * q1 * q2 / distance
 
 
 # Electric potential (voltage): V = k * Q / r
+@precise
 def electric_potential(source_charge: Decimal, distance: Decimal) -> Decimal:
     """Calculate electric potential (V)."""
     return COULOMB_CONSTANT * source_charge / distance
 
 
 # Capacitance of parallel plate: C = ε₀ * A / d
+@precise
 def capacitance(area: Decimal, distance: Decimal) -> Decimal:
     """Calculate capacitance (F)."""
     return VACUUM_PERMITTIVITY * area / distance
 
 
 # Ohm's Law: V = IR
+@precise
 def voltage(current: Decimal, resistance: Decimal) -> Decimal:
     return current * resistance
 
+@precise
 def resistance(voltage: Decimal, current: Decimal) -> Decimal:
     return voltage / current
 
+@precise
 def current(voltage: Decimal, resistance: Decimal) -> Decimal:
     return voltage / resistance
 
 
 # Power: P = IV = I^2 * R = V^2 / R
+@precise
 def electric_power(voltage: Decimal, current: Decimal) -> Decimal:
     return voltage * current
 
 
 # Magnetic force: F = qvB sin(θ), assuming θ = 90°
+@precise
 def magnetic_force(charge: Decimal, velocity: Decimal, magnetic_field: Decimal) -> Decimal:
     """Calculate magnetic force (N)."""
     return charge * velocity * magnetic_field
@@ -5,34 +5,267 @@ Fields Module
 Implements electric, gravitational, and magnetic field equations and forces.
 """
 
-from decimal import Decimal, getcontext
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Tuple
 from Physics.constants import GRAVITATIONAL_CONSTANT, ELEMENTARY_CHARGE, COULOMB_CONSTANT, MU_0, PI
+from Physics.precision import precise
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the array (many-source) functions
+    np = None
+
+# Source × point pairs evaluated per chunk (~2 MB per float64 work array)
+PAIRS_PER_CHUNK = 1 << 18
 
-getcontext().prec = 50
 
 # Gravitational field: g = G * M / r²
+@precise
 def gravitational_field(mass: Decimal, distance: Decimal) -> Decimal:
     """Field strength (N/kg) at distance r from mass M"""
     return GRAVITATIONAL_CONSTANT * mass / distance**2
 
 # Electric field: E = k * Q / r²
+@precise
 def electric_field(charge: Decimal, distance: Decimal) -> Decimal:
     """Electric field (N/C) from point charge at distance r"""
     return COULOMB_CONSTANT * charge / distance**2
 
 # Magnetic field (infinite straight wire): B = μ₀ * I / (2πr)
+@precise
 def magnetic_field(current: Decimal, distance: Decimal) -> Decimal:
     """Magnetic field (Tesla) at distance r from wire carrying current I"""
     return MU_0 * current / (Decimal("2") * PI * distance)
 
 # Gravitational potential energy: U = -G * m1 * m2 / r
+@precise
 def gravitational_potential_energy(m1: Decimal, m2: Decimal, r: Decimal) -> Decimal:
     return -GRAVITATIONAL_CONSTANT * m1 * m2 / r
 
 # Electric potential energy: U = k * q1 * q2 / r
+@precise
 def electric_potential_energy(q1: Decimal, q2: Decimal, r: Decimal) -> Decimal:
     return COULOMB_CONSTANT * q1 * q2 / r
 
+# Superposition of many point sources on many evaluation points
+def _superpose_chunk(points, sources, strengths, coupling, softening):
+    """Σ_s coupling·q_s (p - s)/|p - s|³ and Σ_s coupling·q_s/|p - s| for one block of points."""
+    # Work relative to the chunk's mean point, so the split sum below does not cancel
+    # two large terms when the coordinates are far from the origin
+    origin = points.mean(axis=0)
+    points = points - origin
+    sources = sources - origin
+    dx = points[:, 0, None] - sources[None, :, 0]
+    dy = points[:, 1, None] - sources[None, :, 1]
+    dz = points[:, 2, None] - sources[None, :, 2]
+    r2 = dx * dx
+    r2 += dy * dy
+    r2 += dz * dz
+    coincident = r2 == 0.0
+    r2 += softening * softening
+    with np.errstate(divide="ignore"):
+        inv_r = 1.0 / np.sqrt(r2, out=r2)
+    inv_r[coincident] = 0.0  # a source exerts no field at its own position
+    potential = inv_r @ strengths
+    weights = inv_r * inv_r
+    weights *= inv_r
+    weights *= strengths
+    # Σ q (p - s)/r³ = p Σ q/r³ - Σ q s/r³, the second term as one BLAS product
+    field = points * weights.sum(axis=1)[:, None] - weights @ sources
+    return coupling * field, coupling * potential
+
+def superpose_point_sources(sources, strengths, points, coupling: float, softening: float = 0.0,
+                            workers: int = 1) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Vector field (P, 3) and potential (P,) of S point sources (S, 3) with strengths (S,) at points (P, 3):
+        F(p) = coupling Σ q (p - s)/|p - s|³,   Φ(p) = coupling Σ q/|p - s|
+    Points are processed in chunks of about PAIRS_PER_CHUNK source-point pairs so memory stays bounded;
+    with workers > 1 the chunks run on a thread pool (NumPy releases the GIL inside each chunk).
+    """
+    sources = np.ascontiguousarray(sources, dtype=np.float64).reshape(-1, 3)
+    strengths = np.ascontiguousarray(strengths, dtype=np.float64).ravel()
+    points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+    field = np.empty_like(points)
+    potential = np.empty(len(points))
+    step = max(1, PAIRS_PER_CHUNK // max(len(sources), 1))
+
+    def run(start: int) -> None:
+        stop = start + step
+        field[start:stop], potential[start:stop] = _superpose_chunk(
+            points[start:stop], sources, strengths, coupling, softening)
+
+    _run_chunks(run, len(points), step, workers)
+    return field, potential
+
+def _run_chunks(run, count: int, step: int, workers: int) -> None:
+    """Call run(start) for every chunk start, on a thread pool when workers > 1."""
+    starts = range(0, count, step)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run, starts))
+    else:
+        for start in starts:
+            run(start)
+
+def electric_field_grid(positions, charges, points, softening: float = 0.0,
+                        workers: int = 1) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Electric field E (V/m, shape (P, 3)) and potential V (volts, shape (P,)) of many point charges."""
+    return superpose_point_sources(positions, charges, points, float(COULOMB_CONSTANT), softening, workers)
+
+def gravitational_field_grid(positions, masses, points, softening: float = 0.0,
+                             workers: int = 1) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Gravitational field g (N/kg, shape (P, 3)) and potential Φ (J/kg, shape (P,)) of many point masses."""
+    return superpose_point_sources(positions, masses, points, -float(GRAVITATIONAL_CONSTANT), softening, workers)
+
+# Biot–Savart law for arbitrary wire paths made of straight segments
+def _segments(paths, currents):
+    """Stack polylines ((K, 3) vertex arrays) into segment starts, ends and per-segment currents."""
+    if isinstance(paths, np.ndarray) and paths.ndim == 2:
+        paths = [paths]
+    currents = np.broadcast_to(np.asarray(currents, dtype=np.float64), (len(paths),))
+    starts, ends, segment_currents = [], [], []
+    for path, current in zip(paths, currents):
+        path = np.asarray(path, dtype=np.float64).reshape(-1, 3)
+        starts.append(path[:-1])
+        ends.append(path[1:])
+        segment_currents.append(np.full(len(path) - 1, current))
+    return np.concatenate(starts), np.concatenate(ends), np.concatenate(segment_currents)
+
+def _biot_savart_chunk(points, starts, ends, currents):
+    """
+    Exact field of finite straight segments at a block of points, in the cancellation-free form
+    B = μ₀I/4π · (a × b)/|a × b|² · (l·b/|b| - l·a/|a|),  a = start - p, b = end - p, l = b - a
+    Components are kept as separate (points, segments) arrays so every operation is a flat ufunc.
+    """
+    ax, ay, az = (starts[None, :, i] - points[:, i, None] for i in range(3))
+    bx, by, bz = (ends[None, :, i] - points[:, i, None] for i in range(3))
+    lx, ly, lz = (ends[:, i] - starts[:, i] for i in range(3))
+    cx = ay * bz - az * by
+    cy = az * bx - ax * bz
+    cz = ax * by - ay * bx
+    c2 = cx * cx + cy * cy + cz * cz
+    la = np.sqrt(ax * ax + ay * ay + az * az)
+    lb = np.sqrt(bx * bx + by * by + bz * bz)
+    on_line = c2 <= 1e-30 * (la * lb) ** 2  # point on a segment or its extension: no contribution
+    c2[on_line] = 1.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        factor = currents * ((lx * bx + ly * by + lz * bz) / lb - (lx * ax + ly * ay + lz * az) / la) / c2
+    factor[on_line] = 0.0
+    scale = float(MU_0) / (4 * np.pi)
+    return scale * np.stack([(factor * c).sum(axis=1) for c in (cx, cy, cz)], axis=1)
+
+def biot_savart(paths, currents, points, workers: int = 1) -> "np.ndarray":
+    """
+    Magnetic field B (tesla, shape (P, 3)) at points (P, 3) from current-carrying wire paths.
+    paths is one polyline or a list of polylines, each a (K, 3) array of vertices (close a loop by
+    repeating its first vertex); currents is one value or one per path (amperes, along vertex order).
+    Vectorized over segments × points in bounded chunks, optionally on a thread pool.
+    """
+    starts, ends, segment_currents = _segments(paths, currents)
+    points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+    field = np.empty_like(points)
+    step = max(1, PAIRS_PER_CHUNK // max(len(starts), 1))
+
+    def run(start: int) -> None:
+        field[start:start + step] = _biot_savart_chunk(points[start:start + step], starts, ends, segment_currents)
+
+    _run_chunks(run, len(points), step, workers)
+    return field
+
+def circular_loop(radius: float, segments: int = 128, center=(0.0, 0.0, 0.0)) -> "np.ndarray":
+    """Closed circular loop in a plane of constant z, counter-clockwise seen from +z."""
+    angle = np.linspace(0.0, 2 * np.pi, segments + 1)
+    loop = np.stack((radius * np.cos(angle), radius * np.sin(angle), np.zeros_like(angle)), axis=1)
+    loop[-1] = loop[0]
+    return loop + np.asarray(center, dtype=np.float64)
+
+def helix(radius: float, pitch: float, turns: float, segments_per_turn: int = 64,
+          center=(0.0, 0.0, 0.0)) -> "np.ndarray":
+    """Helical coil (solenoid) along +z, starting at z = center_z."""
+    angle = np.linspace(0.0, 2 * np.pi * turns, int(np.ceil(turns * segments_per_turn)) + 1)
+    coil = np.stack((radius * np.cos(angle), radius * np.sin(angle), pitch * angle / (2 * np.pi)), axis=1)
+    return coil + np.asarray(center, dtype=np.float64)
+
+# Grid (mesh) potentials: ∇²φ = -4π c ρ, i.e. φ(r) = c ∫ ρ(r') / |r - r'| dV' in 3D
+POISSON_BOUNDARIES = ("periodic", "isolated")
+
+def _wave_numbers(shape, spacing):
+    """Angular wave numbers for an rfftn of the given shape, broadcastable against its output."""
+    ks = []
+    for axis, (n, h) in enumerate(zip(shape, spacing)):
+        k = 2 * np.pi * (np.fft.rfftfreq(n, h) if axis == len(shape) - 1 else np.fft.fftfreq(n, h))
+        view = [1] * len(shape)
+        view[axis] = len(k)
+        ks.append(k.reshape(view))
+    return ks
+
+def _isolated_kernels(shape, spacing, coupling):
+    """
+    Free-space Green's function and its (negative) gradient on the doubled grid, with wrap-around offsets.
+    The self cell uses the exact cell average of the kernel (cubic/square-cell closed forms).
+    """
+    axes = [h * np.where(np.arange(2 * n) < n, np.arange(2 * n), np.arange(2 * n) - 2 * n)
+            for n, h in zip(shape, spacing)]
+    offsets = np.meshgrid(*axes, indexing="ij")
+    r2 = sum(o * o for o in offsets)
+    r2.flat[0] = 1.0
+    cell = float(np.prod(spacing))
+    h = cell ** (1 / len(shape))
+    if len(shape) == 3:
+        green = coupling * cell / np.sqrt(r2)
+        green.flat[0] = coupling * (3 * np.log(2 + np.sqrt(3)) - np.pi / 2) * h * h
+        radial = coupling * cell / (r2 * np.sqrt(r2))
+    else:
+        # 2D: φ = -2c ∫ ρ ln|r - r'| dA'; cell average of ln r over a square of side h
+        green = -coupling * cell * np.log(r2)
+        green.flat[0] = -2 * coupling * cell * (np.log(h) + np.pi / 4 - 1.5 - np.log(2) / 2)
+        radial = 2 * coupling * cell / r2
+    radial.flat[0] = 0.0
+    return green, [radial * o for o in offsets]
+
+def poisson_solve(density, spacing, coupling: float, boundary: str = "isolated") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    FFT solution of ∇²φ = -4π·coupling·ρ on a 2D or 3D grid, in O(N log N).
+    Returns (potential φ, field -∇φ) with the field's components on the last axis.
+    boundary "periodic": the grid tiles space (the mean density is dropped, as it must be).
+    boundary "isolated": zero-padded convolution with the free-space kernel (Hockney–Eastwood),
+    which in 3D reproduces c·q/r and c·q·r̂/r² of the point-source formulas away from the charge.
+    """
+    density = np.asarray(density, dtype=np.float64)
+    if density.ndim not in (2, 3):
+        raise ValueError(f"density must be a 2D or 3D grid, got {density.ndim}D")
+    if boundary not in POISSON_BOUNDARIES:
+        raise ValueError(f"boundary must be one of {POISSON_BOUNDARIES}, not {boundary!r}")
+    shape = density.shape
+    spacing = tuple(float(h) for h in np.broadcast_to(spacing, (density.ndim,)))
+    if boundary == "periodic":
+        ks = _wave_numbers(shape, spacing)
+        k2 = sum(k * k for k in ks)
+        k2.flat[0] = 1.0
+        phi_k = 4 * np.pi * coupling * np.fft.rfftn(density) / k2
+        phi_k.flat[0] = 0.0
+        axes = tuple(range(density.ndim))
+        potential = np.fft.irfftn(phi_k, s=shape, axes=axes)
+        field = np.stack([np.fft.irfftn(-1j * k * phi_k, s=shape, axes=axes) for k in ks], axis=-1)
+        return potential, field
+    padded = tuple(2 * n for n in shape)
+    axes = tuple(range(density.ndim))
+    rho_k = np.fft.rfftn(density, s=padded, axes=axes)
+    green, gradient = _isolated_kernels(shape, spacing, coupling)
+    crop = tuple(slice(0, n) for n in shape)
+    potential = np.fft.irfftn(rho_k * np.fft.rfftn(green), s=padded, axes=axes)[crop]
+    field = np.stack([np.fft.irfftn(rho_k * np.fft.rfftn(g), s=padded, axes=axes)[crop] for g in gradient], axis=-1)
+    return potential, field
+
+def electric_potential_grid(charge_density, spacing, boundary: str = "isolated") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Potential V (volts) and field E (V/m) of a charge density grid (C/m³, or C/m² in 2D)."""
+    return poisson_solve(charge_density, spacing, float(COULOMB_CONSTANT), boundary)
+
+def gravitational_potential_grid(mass_density, spacing, boundary: str = "isolated") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Potential Φ (J/kg) and field g (N/kg) of a mass density grid (kg/m³, or kg/m² in 2D)."""
+    return poisson_solve(mass_density, spacing, -float(GRAVITATIONAL_CONSTANT), boundary)
+
 # Example usage
 if __name__ == "__main__":
     M = Decimal("5.97e24")  # Earth mass in kg
@@ -46,3 +279,16 @@ if __name__ == "__main__":
     I = Decimal("5.0")  # Amperes
     r_wire = Decimal("0.05")  # 5 cm
     print("Magnetic field near wire:", magnetic_field(I, r_wire), "T")
+
+    if np is not None:
+        E, V = electric_field_grid([[0.0, 0.0, 0.0]], [float(Q)], [[0.01, 0.0, 0.0]])
+        print("Same charge via electric_field_grid:", E[0], "N/C,", V[0], "V")
+
+        # Cross-check the mesh solver against the point-charge formula: one charged cell, 32³ grid
+        h = 0.001
+        rho = np.zeros((32, 32, 32))
+        rho[8, 8, 8] = float(Q) / h ** 3
+        V_grid, E_grid = electric_potential_grid(rho, h)
+        loop_B = biot_savart(circular_loop(0.05), 5.0, [[0.0, 0.0, 0.0]])
+        print("Loop centre B (R=5cm, I=5A):", loop_B[0, 2], "T vs μ₀I/2R =", MU_0 * I / (2 * Decimal("0.05")))
+        print("Mesh E 1cm away:", E_grid[18, 8, 8, 0], "N/C vs formula", electric_field(Q, Decimal("0.01")))
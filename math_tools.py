@@ -2,19 +2,32 @@
 
 """
 Math Tools Module
-Provides vector and matrix operations, integration, and tensor placeholders.
+Provides vector and matrix operations, integration, and ndarray-backed tensors.
+Vec3/VecN are compact __slots__ vectors; VecArray holds a batch of vectors in one float64 buffer.
 """
 
+import math
 from decimal import Decimal
-from typing import List
+from operator import mul
+from typing import Iterator, List, Optional, Union
+
+from Physics.precision import precise
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the array-backed types
+    np = None
 
 # Vector operations
+@precise
 def vector_add(v1: List[Decimal], v2: List[Decimal]) -> List[Decimal]:
     return [a + b for a, b in zip(v1, v2)]
 
+@precise
 def dot_product(v1: List[Decimal], v2: List[Decimal]) -> Decimal:
     return sum(a * b for a, b in zip(v1, v2))
 
+@precise
 def cross_product(v1: List[Decimal], v2: List[Decimal]) -> List[Decimal]:
     return [
         v1[1]*v2[2] - v1[2]*v2[1],
@@ -22,18 +35,232 @@ def cross_product(v1: List[Decimal], v2: List[Decimal]) -> List[Decimal]:
         v1[0]*v2[1] - v1[1]*v2[0]
     ]
 
+def _sqrt(value):
+    return value.sqrt() if isinstance(value, Decimal) else math.sqrt(value)
+
+# Compact vector types: __slots__ objects for scalar work (Decimal or float components)
+class Vec3:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __iter__(self) -> Iterator:
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: int):
+        return (self.x, self.y, self.z)[index]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Vec3) and (self.x, self.y, self.z) == (other.x, other.y, other.z)
+
+    def __add__(self, other: "Vec3") -> "Vec3":
+        return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: "Vec3") -> "Vec3":
+        return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, scalar) -> "Vec3":
+        return Vec3(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Vec3":
+        return Vec3(-self.x, -self.y, -self.z)
+
+    def dot(self, other: "Vec3"):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: "Vec3") -> "Vec3":
+        return Vec3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    def norm(self):
+        return _sqrt(self.dot(self))
+
+    def __repr__(self):
+        return f"Vec3({self.x}, {self.y}, {self.z})"
+
+class VecN:
+    __slots__ = ("components",)
+
+    def __init__(self, *components):
+        self.components = tuple(components)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.components)
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def __getitem__(self, index: int):
+        return self.components[index]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, VecN) and self.components == other.components
+
+    def __add__(self, other: "VecN") -> "VecN":
+        return VecN(*(a + b for a, b in zip(self.components, other.components)))
+
+    def __sub__(self, other: "VecN") -> "VecN":
+        return VecN(*(a - b for a, b in zip(self.components, other.components)))
+
+    def __mul__(self, scalar) -> "VecN":
+        return VecN(*(a * scalar for a in self.components))
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "VecN":
+        return VecN(*(-a for a in self.components))
+
+    def dot(self, other: "VecN"):
+        return sum(a * b for a, b in zip(self.components, other.components))
+
+    def norm(self):
+        return _sqrt(self.dot(self))
+
+    def __repr__(self):
+        return f"VecN{self.components}"
+
+# Batch of M vectors in one contiguous (M, N) float64 buffer; operations work in place where possible
+class VecArray:
+    __slots__ = ("data", "_scratch")
+
+    def __init__(self, data):
+        self.data = np.ascontiguousarray(data, dtype=np.float64)
+        if self.data.ndim != 2:
+            raise ValueError(f"VecArray needs an (M, N) array, got shape {self.data.shape}")
+        self._scratch = None
+
+    @classmethod
+    def zeros(cls, count: int, dim: int = 3) -> "VecArray":
+        return cls(np.zeros((count, dim)))
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __repr__(self):
+        return f"VecArray(count={self.data.shape[0]}, dim={self.data.shape[1]})"
+
+    def _temp(self) -> "np.ndarray":
+        if self._scratch is None:
+            self._scratch = np.empty_like(self.data)
+        return self._scratch
+
+    def __iadd__(self, other: Union["VecArray", "np.ndarray"]) -> "VecArray":
+        self.data += _array_data(other)
+        return self
+
+    def __isub__(self, other: Union["VecArray", "np.ndarray"]) -> "VecArray":
+        self.data -= _array_data(other)
+        return self
+
+    def __imul__(self, scalar) -> "VecArray":
+        self.data *= _array_data(scalar)
+        return self
+
+    def dot(self, other: Union["VecArray", "np.ndarray"], out: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """Row-wise dot products, shape (M,)."""
+        return np.einsum("ij,ij->i", self.data, _array_data(other), out=out)
+
+    def norm(self, out: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """Row-wise Euclidean norms, shape (M,)."""
+        out = self.dot(self, out=out)
+        return np.sqrt(out, out=out)
+
+    def normalize(self) -> "VecArray":
+        """Scale every row to unit length in place (zero rows stay zero)."""
+        lengths = self.norm()
+        lengths[lengths == 0] = 1.0
+        self.data /= lengths[:, None]
+        return self
+
+    def cross(self, other: Union["VecArray", "np.ndarray"], out: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """Row-wise cross products (N = 3); out may alias self.data for an in-place update."""
+        a, b = self.data, _array_data(other)
+        if a.shape[1] != 3:
+            raise ValueError("cross product needs 3-component vectors")
+        if out is None:
+            out = np.empty_like(a)
+        result = self._temp() if np.shares_memory(out, a) or np.shares_memory(out, b) else out
+        column = np.empty(len(a))
+        for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+            np.multiply(a[:, j], b[:, k], out=result[:, i])
+            np.multiply(a[:, k], b[:, j], out=column)
+            result[:, i] -= column
+        if result is not out:
+            out[...] = result
+        return out
+
+def _array_data(value):
+    return value.data if isinstance(value, VecArray) else value
+
 # Matrix multiplication
-def matrix_multiply(A: List[List[Decimal]], B: List[List[Decimal]]) -> List[List[Decimal]]:
-    result = []
-    for i in range(len(A)):
-        row = []
-        for j in range(len(B[0])):
-            val = sum(A[i][k] * B[k][j] for k in range(len(B)))
-            row.append(val)
-        result.append(row)
+MATMUL_METHODS = ("auto", "blas", "exact")
+
+def _is_float_matrix(M) -> bool:
+    if np is not None and isinstance(M, np.ndarray):
+        return M.dtype.kind == "f"
+    return all(isinstance(value, float) for row in M for value in row)
+
+def _matmul_blas(A, B):
+    """Float64 product through NumPy (BLAS); lists in, lists out."""
+    product = np.asarray(A, dtype=np.float64) @ np.asarray(B, dtype=np.float64)
+    if isinstance(A, np.ndarray) or isinstance(B, np.ndarray):
+        return product
+    return product.tolist()
+
+@precise
+def _matmul_exact(A, B, block_size: int):
+    """
+    Exact product for Decimal/Fraction/int entries, tiled block_size × block_size over the output.
+    B is transposed once so every entry is a sum over two contiguous rows. ndarrays are read as
+    Python scalars (tolist), so integer entries never wrap around in int64.
+    """
+    A, B = (M.tolist() if np is not None and isinstance(M, np.ndarray) else M for M in (A, B))
+    B_cols = [list(col) for col in zip(*B)]
+    result = [[None] * len(B_cols) for _ in range(len(A))]
+    for i0 in range(0, len(A), block_size):
+        rows = A[i0:i0 + block_size]
+        for j0 in range(0, len(B_cols), block_size):
+            cols = B_cols[j0:j0 + block_size]
+            for i, row in enumerate(rows, start=i0):
+                out = result[i]
+                for j, col in enumerate(cols, start=j0):
+                    out[j] = sum(map(mul, row, col))
     return result
 
+def matrix_multiply(A: List[List[Decimal]], B: List[List[Decimal]], method: str = "auto", block_size: int = 64) -> List[List[Decimal]]:
+    """
+    Matrix product A·B.
+    method "auto" sends float matrices (float ndarrays or lists of floats) to NumPy/BLAS and everything else
+    (Decimal, Fraction, int, including integer ndarrays) to the blocked exact path, which returns lists;
+    "blas" and "exact" force a path.
+    """
+    if method not in MATMUL_METHODS:
+        raise ValueError(f"method must be one of {MATMUL_METHODS}, not {method!r}")
+    if method == "auto":
+        use_blas = np is not None and _is_float_matrix(A) and _is_float_matrix(B)
+        method = "blas" if use_blas else "exact"
+    if method == "blas":
+        return _matmul_blas(A, B)
+    return _matmul_exact(A, B, block_size)
+
 # Numerical integration (trapezoidal rule)
+@precise
 def trapezoidal_integrate(x: List[Decimal], y: List[Decimal]) -> Decimal:
     integral = Decimal("0")
     for i in range(1, len(x)):
@@ -42,14 +269,130 @@ def trapezoidal_integrate(x: List[Decimal], y: List[Decimal]) -> Decimal:
         integral += dx * avg_y
     return integral
 
-# Tensor stub (symbolic tensor representation)
+# Tensor backed by an ndarray; each index is contravariant ("u", upper) or covariant ("l", lower)
 class Tensor:
-    def __init__(self, rank: int, components: List):
+    def __init__(self, rank: int, components, variance: Optional[str] = None):
+        array = np.asarray(components)  # Decimal/Fraction entries keep exact object arithmetic
+        if array.ndim != rank:
+            raise ValueError(f"rank {rank} does not match components of shape {array.shape}")
+        variance = "u" * rank if variance is None else variance
+        if len(variance) != rank or set(variance) - {"u", "l"}:
+            raise ValueError(f"variance must be {rank} characters of 'u'/'l', got {variance!r}")
         self.rank = rank
-        self.components = components
+        self.components = array
+        self.variance = variance
+
+    @property
+    def shape(self):
+        return self.components.shape
 
     def __repr__(self):
-        return f"Tensor(rank={self.rank}, components={self.components})"
+        return f"Tensor(rank={self.rank}, variance={self.variance!r}, components={self.components.tolist()})"
+
+    def __getitem__(self, index):
+        return self.components[index]
+
+    def __add__(self, other: "Tensor") -> "Tensor":
+        self._check_variance(other)
+        return Tensor(self.rank, self.components + other.components, self.variance)
+
+    def __sub__(self, other: "Tensor") -> "Tensor":
+        self._check_variance(other)
+        return Tensor(self.rank, self.components - other.components, self.variance)
+
+    def __mul__(self, scalar) -> "Tensor":
+        return Tensor(self.rank, self.components * scalar, self.variance)
+
+    __rmul__ = __mul__
+
+    def _check_variance(self, other: "Tensor") -> None:
+        if self.variance != other.variance:
+            raise ValueError(f"index positions differ: {self.variance!r} vs {other.variance!r}")
+
+    def transpose(self, *axes: int) -> "Tensor":
+        """Permute indices; returns a view sharing memory with this tensor (no copy)."""
+        axes = axes or tuple(reversed(range(self.rank)))
+        return Tensor(self.rank, self.components.transpose(axes), "".join(self.variance[a] for a in axes))
+
+    @property
+    def T(self) -> "Tensor":
+        return self.transpose()
+
+    def outer(self, other: "Tensor") -> "Tensor":
+        """Tensor (outer) product; the result carries the indices of self followed by those of other."""
+        return Tensor(self.rank + other.rank, np.multiply.outer(self.components, other.components),
+                      self.variance + other.variance)
+
+    def contract(self, i: int, j: int) -> "Tensor":
+        """Trace over an upper/lower index pair (i, j)."""
+        if {self.variance[i], self.variance[j]} != {"u", "l"}:
+            raise ValueError("contraction needs one upper and one lower index")
+        variance = "".join(v for k, v in enumerate(self.variance) if k not in (i, j))
+        return Tensor(self.rank - 2, np.trace(self.components, axis1=i, axis2=j), variance)
+
+    def lower(self, index: int, metric: "Tensor") -> "Tensor":
+        """Lower one index with the metric g_{μν}."""
+        return self._move_index(index, metric.components, "u", "l")
+
+    def raise_index(self, index: int, metric: "Tensor") -> "Tensor":
+        """Raise one index with the inverse metric g^{μν}."""
+        return self._move_index(index, _inverse_metric(metric), "l", "u")
+
+    def _move_index(self, index: int, g: "np.ndarray", before: str, after: str) -> "Tensor":
+        if self.variance[index] != before:
+            raise ValueError(f"index {index} is already {'lower' if before == 'u' else 'upper'}")
+        moved = np.moveaxis(np.tensordot(g, self.components, axes=([1], [index])), 0, index)
+        variance = self.variance[:index] + after + self.variance[index + 1:]
+        return Tensor(self.rank, moved, variance)
+
+    @staticmethod
+    def einsum(subscripts: str, *tensors: "Tensor") -> "Tensor":
+        """
+        Einstein-summation contraction, e.g. Tensor.einsum("ij,j->i", g, v).
+        The output indices inherit their upper/lower position from the inputs.
+        """
+        if "->" not in subscripts:
+            raise ValueError("subscripts need an explicit output, e.g. 'ij,j->i'")
+        inputs, output = subscripts.replace(" ", "").split("->")
+        positions = {}
+        for labels, tensor in zip(inputs.split(","), tensors):
+            positions.update(zip(labels, tensor.variance))
+        components = np.einsum(subscripts, *(t.components for t in tensors), optimize=len(tensors) > 2)
+        return Tensor(len(output), components, "".join(positions[label] for label in output))
+
+def _inverse_metric(metric: Tensor) -> "np.ndarray":
+    """g^{μν} in the metric's own dtype: diagonal metrics invert elementwise, so Decimal entries stay exact."""
+    g = metric.components
+    if not g[~np.eye(len(g), dtype=bool)].any():
+        diagonal = 1 / np.diagonal(g)
+        inverse = np.zeros(g.shape, dtype=diagonal.dtype)
+        np.fill_diagonal(inverse, diagonal)
+        return inverse
+    if g.dtype == object:
+        return _exact_inverse(g)
+    return np.linalg.inv(g)
+
+@precise
+def _exact_inverse(g: "np.ndarray") -> "np.ndarray":
+    """Gauss-Jordan inverse of an object (Decimal/Fraction) matrix with partial pivoting on nonzero entries."""
+    n = len(g)
+    rows = [list(row) + [1 if i == j else 0 for j in range(n)] for i, row in enumerate(g)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if rows[r][col] != 0), None)
+        if pivot is None:
+            raise ValueError("metric is singular")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        lead = rows[col][col]
+        rows[col] = [v / lead for v in rows[col]]
+        for r in range(n):
+            if r != col and rows[r][col] != 0:
+                factor = rows[r][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return np.array([row[n:] for row in rows], dtype=object)
+
+def minkowski_metric(signature: str = "+---") -> Tensor:
+    """Flat spacetime metric η_{μν} (default particle-physics signature +,-,-,-) as a covariant rank-2 Tensor."""
+    return Tensor(2, np.diag([1.0 if sign == "+" else -1.0 for sign in signature]), "ll")
 
 # Example usage
 if __name__ == "__main__":
@@ -59,6 +402,7 @@ if __name__ == "__main__":
     print("Dot Product:", dot_product(v1, v2))
     print("Cross Product:", cross_product(v1, v2))
     print("Vector Add:", vector_add(v1, v2))
+    print("Vec3 Cross:", Vec3(*v1).cross(Vec3(*v2)), "Norm:", Vec3(*v1).norm())
 
     A = [
         [Decimal("1"), Decimal("2")],
@@ -73,3 +417,8 @@ if __name__ == "__main__":
     x_vals = [Decimal("0"), Decimal("1"), Decimal("2")]
     y_vals = [Decimal("0"), Decimal("1"), Decimal("4")]
     print("Trapezoidal Integral:", trapezoidal_integrate(x_vals, y_vals))
+
+    if np is not None:
+        eta = minkowski_metric()
+        p = Tensor(1, [5.0, 1.0, 2.0, 3.0])
+        print("Invariant mass² p^μ p_μ:", Tensor.einsum("i,i->", p, p.lower(0, eta)).components)
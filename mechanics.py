@@ -3,69 +3,147 @@
 """
 Classical Mechanics Module
 Implements core laws of motion, force, energy, and gravity based on Newtonian physics.
+
+Every formula accepts either Decimal scalars (exact path) or NumPy arrays.
+When any argument is an ndarray, all arguments are converted to float64 and
+broadcast together, so a whole batch is evaluated in a single vectorized call.
+Scalar calls run as @precise formulas under the active precision policy.
 """
 
+import sys
 from decimal import Decimal
+from functools import wraps
+from typing import Callable, Optional, Tuple, Union
 from Physics.constants import GRAVITATIONAL_CONSTANT, STANDARD_GRAVITY
+from Physics.precision import precise
+
+Quantity = Union[Decimal, "numpy.ndarray"]
+
+_G = float(GRAVITATIONAL_CONSTANT)
+
+
+def _float_arrays(*values) -> Optional[Tuple["numpy.ndarray", ...]]:
+    """Return the values as float64 arrays if any of them is an ndarray, else None."""
+    # An ndarray argument implies NumPy is already imported; never import it here,
+    # so the Decimal path keeps working (and starting fast) without NumPy.
+    np = sys.modules.get("numpy")
+    if np is None or not any(isinstance(v, np.ndarray) for v in values):
+        return None
+    return tuple(np.asarray(v, dtype=np.float64) for v in values)
+
+
+def _formula(func: Callable) -> Callable:
+    """Send ndarray calls straight to the float64 path; wrap the Decimal path with @precise."""
+    exact = precise(func)
+
+    @wraps(func)
+    def wrapper(*args, precision: Optional[str] = None, **kwargs):
+        if _float_arrays(*args, *kwargs.values()) is not None:
+            return func(*args, **kwargs)
+        return exact(*args, precision=precision, **kwargs)
+    return wrapper
 
 
 # Newton's Second Law: F = ma
-def force(mass: Decimal, acceleration: Decimal) -> Decimal:
+@_formula
+def force(mass: Quantity, acceleration: Quantity) -> Quantity:
     """Calculate force (N) given mass (kg) and acceleration (m/s^2)."""
+    arrays = _float_arrays(mass, acceleration)
+    if arrays is not None:
+        mass, acceleration = arrays
     return mass * acceleration
 
 
 # Acceleration: a = (v_final - v_initial) / t
-def acceleration(v_final: Decimal, v_initial: Decimal, time: Decimal) -> Decimal:
+@_formula
+def acceleration(v_final: Quantity, v_initial: Quantity, time: Quantity) -> Quantity:
     """Calculate acceleration (m/s^2) from change in velocity over time."""
+    arrays = _float_arrays(v_final, v_initial, time)
+    if arrays is not None:
+        v_final, v_initial, time = arrays
     return (v_final - v_initial) / time
 
 
 # Velocity: v = v_initial + at
-def velocity(v_initial: Decimal, acceleration: Decimal, time: Decimal) -> Decimal:
+@_formula
+def velocity(v_initial: Quantity, acceleration: Quantity, time: Quantity) -> Quantity:
     """Calculate final velocity (m/s)."""
+    arrays = _float_arrays(v_initial, acceleration, time)
+    if arrays is not None:
+        v_initial, acceleration, time = arrays
     return v_initial + acceleration * time
 
 
 # Displacement: s = v_initial * t + 0.5 * a * t^2
-def displacement(v_initial: Decimal, acceleration: Decimal, time: Decimal) -> Decimal:
+@_formula
+def displacement(v_initial: Quantity, acceleration: Quantity, time: Quantity) -> Quantity:
     """Calculate displacement (m)."""
+    arrays = _float_arrays(v_initial, acceleration, time)
+    if arrays is not None:
+        v_initial, acceleration, time = arrays
+        return v_initial * time + 0.5 * acceleration * (time ** 2)
     return v_initial * time + Decimal("0.5") * acceleration * (time ** 2)
 
 
 # Kinetic Energy: KE = 0.5 * m * v^2
-def kinetic_energy(mass: Decimal, velocity: Decimal) -> Decimal:
+@_formula
+def kinetic_energy(mass: Quantity, velocity: Quantity) -> Quantity:
     """Calculate kinetic energy (J)."""
+    arrays = _float_arrays(mass, velocity)
+    if arrays is not None:
+        mass, velocity = arrays
+        return 0.5 * mass * (velocity ** 2)
     return Decimal("0.5") * mass * (velocity ** 2)
 
 
 # Potential Energy (gravitational): PE = m * g * h
-def potential_energy(mass: Decimal, height: Decimal, gravity: Decimal = STANDARD_GRAVITY) -> Decimal:
+@_formula
+def potential_energy(mass: Quantity, height: Quantity, gravity: Quantity = STANDARD_GRAVITY) -> Quantity:
     """Calculate gravitational potential energy (J)."""
+    arrays = _float_arrays(mass, height, gravity)
+    if arrays is not None:
+        mass, height, gravity = arrays
     return mass * gravity * height
 
 
 # Momentum: p = m * v
-def momentum(mass: Decimal, velocity: Decimal) -> Decimal:
+@_formula
+def momentum(mass: Quantity, velocity: Quantity) -> Quantity:
     """Calculate momentum (kg·m/s)."""
+    arrays = _float_arrays(mass, velocity)
+    if arrays is not None:
+        mass, velocity = arrays
     return mass * velocity
 
 
 # Gravitational Force: F = G * m1 * m2 / r^2
-def gravitational_force(m1: Decimal, m2: Decimal, distance: Decimal) -> Decimal:
+@_formula
+def gravitational_force(m1: Quantity, m2: Quantity, distance: Quantity) -> Quantity:
     """Calculate gravitational force between two masses (N)."""
+    arrays = _float_arrays(m1, m2, distance)
+    if arrays is not None:
+        m1, m2, distance = arrays
+        return _G * m1 * m2 / (distance ** 2)
     return GRAVITATIONAL_CONSTANT * m1 * m2 / (distance ** 2)
 
 
 # Work: W = F * d
-def work(force: Decimal, displacement: Decimal) -> Decimal:
+@_formula
+def work(force: Quantity, displacement: Quantity) -> Quantity:
     """Calculate work (J)."""
+    arrays = _float_arrays(force, displacement)
+    if arrays is not None:
+        force, displacement = arrays
     return force * displacement
 
 
 # Power: P = W / t
-def power(work: Decimal, time: Decimal) -> Decimal:
+@_formula
+def power(work: Quantity, time: Quantity) -> Quantity:
     """Calculate power (W)."""
+    arrays = _float_arrays(work, time)
+    if arrays is not None:
+        work, time = arrays
     return work / time
 
 
@@ -79,3 +157,11 @@ if __name__ == "__main__":
     print("Force:", force(m, a), "N")
     print("Kinetic Energy:", kinetic_energy(m, v), "J")
     print("Potential Energy:", potential_energy(m, h), "J")
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        masses = np.array([1.0, 2.0, 3.0])
+        print("Kinetic Energy (batch):", kinetic_energy(masses, v), "J")
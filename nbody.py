@@ -0,0 +1,235 @@
+# Physics/nbody.py
+
+"""
+N-Body Gravity Module
+Evolves many gravitating bodies at once, built on Newton's law of gravitation
+(mechanics.gravitational_force) applied to whole arrays of positions and masses.
+
+Two force solvers are provided:
+    direct      O(N²) vectorized pairwise sum, exact (best for small N)
+    barnes-hut  O(N log N) octree with opening angle θ (for large N)
+Time integration uses the symplectic kick-drift-kick leapfrog, which keeps the
+energy error bounded; the relative energy drift is tracked along the run.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from Physics.constants import GRAVITATIONAL_CONSTANT
+
+G = float(GRAVITATIONAL_CONSTANT)
+
+SOLVERS = ("auto", "direct", "barnes-hut")
+DIRECT_MAX_BODIES = 2000        # "auto" switches to Barnes–Hut above this
+_MAX_DEPTH = 21                 # 21 bits per axis in a 63-bit Morton code
+_PAIR_BUDGET = 4_000_000        # pairs held in memory at once by either solver
+
+
+def direct_accelerations(positions: np.ndarray, masses: np.ndarray, softening: float = 0.0,
+                         G: float = G) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact accelerations (N, 3) and potentials (N,) by direct summation over all pairs,
+    computed in row blocks so memory stays bounded. Plummer softening ε: r² → r² + ε².
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    masses = np.asarray(masses, dtype=np.float64)
+    n = len(positions)
+    acc = np.empty((n, 3))
+    phi = np.empty(n)
+    block = max(1, _PAIR_BUDGET // max(n, 1))
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        d = positions[None, :, :] - positions[start:stop, None, :]        # (b, N, 3)
+        r2 = np.einsum("ijk,ijk->ij", d, d) + softening ** 2
+        rows = np.arange(stop - start)
+        r2[rows, rows + start] = np.inf                                   # no self-interaction
+        inv_r = 1.0 / np.sqrt(r2)
+        weighted = masses * inv_r                                        # m_j / r_ij
+        phi[start:stop] = -G * weighted.sum(axis=1)
+        acc[start:stop] = G * np.einsum("ij,ijk->ik", weighted * inv_r * inv_r, d)
+    return acc, phi
+
+
+def _morton_codes(positions: np.ndarray, lo: np.ndarray, size: float) -> np.ndarray:
+    scaled = ((positions - lo) / size * (1 << _MAX_DEPTH)).astype(np.uint64)
+    scaled = np.minimum(scaled, np.uint64((1 << _MAX_DEPTH) - 1))
+    spread = []
+    for axis in range(3):
+        v = scaled[:, axis]
+        v = (v | (v << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+        v = (v | (v << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+        v = (v | (v << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+        v = (v | (v << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+        v = (v | (v << np.uint64(2))) & np.uint64(0x1249249249249249)
+        spread.append(v)
+    return (spread[0] << np.uint64(2)) | (spread[1] << np.uint64(1)) | spread[2]
+
+
+class Octree:
+    """
+    Linear octree built level by level from Morton-sorted bodies.
+    Each node stores its mass, centre of mass, cell size and the contiguous range of its children;
+    a node holding a single body records that body's index (leaf_body), otherwise -1.
+    """
+
+    def __init__(self, positions: np.ndarray, masses: np.ndarray):
+        positions = np.asarray(positions, dtype=np.float64)
+        masses = np.asarray(masses, dtype=np.float64)
+        lo = positions.min(axis=0)
+        size = float((positions.max(axis=0) - lo).max()) * (1 + 1e-9) or 1.0
+        codes = _morton_codes(positions, lo, size)
+        order = np.argsort(codes, kind="stable")
+        codes, pos, m = codes[order], positions[order], masses[order]
+        weighted = pos * m[:, None]
+
+        mass = [np.array([m.sum()])]
+        com = [weighted.sum(axis=0, keepdims=True) / m.sum()]
+        cell = [np.array([size])]
+        count = [np.array([len(m)])]
+        parent = [np.array([-1])]
+        first = [np.array([0])]  # first sorted body of each node
+
+        active = np.arange(len(m))                       # sorted bodies still in multi-body nodes
+        node_of_active = np.zeros(len(m), dtype=np.int64)
+        offset = 1                                       # global id of the next level's first node
+        depth = 0
+        while len(active) and depth < _MAX_DEPTH:
+            depth += 1
+            prefix = codes[active] >> np.uint64(3 * (_MAX_DEPTH - depth))
+            starts = np.flatnonzero(np.concatenate(([True], prefix[1:] != prefix[:-1])))
+            level_count = np.diff(np.append(starts, len(active)))
+            level_mass = np.add.reduceat(m[active], starts)
+            mass.append(level_mass)
+            com.append(np.add.reduceat(weighted[active], starts) / level_mass[:, None])
+            cell.append(np.full(len(starts), size / 2 ** depth))
+            count.append(level_count)
+            parent.append(node_of_active[starts])
+            first.append(active[starts])
+            ids = offset + np.arange(len(starts))
+            keep = np.repeat(level_count > 1, level_count)
+            node_of_active = np.repeat(ids, level_count)[keep]
+            active = active[keep]
+            offset += len(starts)
+
+        self.mass = np.concatenate(mass)
+        self.com = np.concatenate(com)
+        self.cell = np.concatenate(cell)
+        count = np.concatenate(count)
+        parent = np.concatenate(parent)
+        first = np.concatenate(first)
+        self.leaf_body = np.where(count == 1, order[first], -1)
+        # Children of a node are contiguous in the next level, so each node keeps a [start, end) range
+        self.child_start = np.zeros(len(count), dtype=np.int64)
+        self.child_end = np.zeros(len(count), dtype=np.int64)
+        ids = np.arange(len(count))
+        has_parent = parent >= 0
+        parents, first_child, n_children = np.unique(parent[has_parent], return_index=True, return_counts=True)
+        self.child_start[parents] = ids[has_parent][first_child]
+        self.child_end[parents] = self.child_start[parents] + n_children
+        self.depth = depth
+
+    def __len__(self) -> int:
+        return len(self.mass)
+
+    def accelerations(self, positions: np.ndarray, theta: float = 0.5, softening: float = 0.0,
+                      G: float = G) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Accelerations (N, 3) and potentials (N,) at the tree's bodies (positions in the same order).
+        A node is used as a point mass when cell / distance < θ, otherwise it is opened; the walk is
+        vectorized over (body, node) pairs and done in body blocks to bound memory.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        n = len(positions)
+        acc = np.zeros((n, 3))
+        phi = np.zeros(n)
+        theta2, eps2 = theta * theta, softening * softening
+        block = max(1, _PAIR_BUDGET // 256)
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            bodies = np.arange(start, stop)
+            nodes = np.zeros(len(bodies), dtype=np.int64)
+            while len(bodies):
+                d = self.com[nodes] - positions[bodies]
+                r2 = np.einsum("ij,ij->i", d, d) + eps2
+                leaf = self.child_start[nodes] == self.child_end[nodes]
+                accept = leaf | (self.cell[nodes] ** 2 < theta2 * r2)
+                use = accept & (self.leaf_body[nodes] != bodies)
+                local = bodies[use] - start
+                inv_r = 1.0 / np.sqrt(r2[use])
+                gm_inv_r = G * self.mass[nodes[use]] * inv_r
+                phi[start:stop] -= np.bincount(local, gm_inv_r, minlength=stop - start)
+                scale = gm_inv_r * inv_r * inv_r
+                for axis in range(3):
+                    acc[start:stop, axis] += np.bincount(local, scale * d[use, axis], minlength=stop - start)
+                # Replace every opened node by its children
+                opened = ~accept
+                bodies, nodes = bodies[opened], nodes[opened]
+                n_children = self.child_end[nodes] - self.child_start[nodes]
+                bodies = np.repeat(bodies, n_children)
+                base = np.repeat(self.child_start[nodes] - np.cumsum(n_children) + n_children, n_children)
+                nodes = base + np.arange(len(bodies))
+        return acc, phi
+
+
+def barnes_hut_accelerations(positions: np.ndarray, masses: np.ndarray, theta: float = 0.5,
+                             softening: float = 0.0, G: float = G) -> Tuple[np.ndarray, np.ndarray]:
+    """Approximate accelerations (N, 3) and potentials (N,) with a freshly built Barnes–Hut octree."""
+    return Octree(positions, masses).accelerations(positions, theta, softening, G)
+
+
+def accelerations(positions: np.ndarray, masses: np.ndarray, solver: str = "auto", theta: float = 0.5,
+                  softening: float = 0.0, G: float = G) -> Tuple[np.ndarray, np.ndarray]:
+    """Dispatch to the direct or Barnes–Hut solver ("auto": direct up to DIRECT_MAX_BODIES bodies)."""
+    if solver not in SOLVERS:
+        raise ValueError(f"solver must be one of {SOLVERS}, not {solver!r}")
+    if solver == "direct" or (solver == "auto" and len(positions) <= DIRECT_MAX_BODIES):
+        return direct_accelerations(positions, masses, softening, G)
+    return barnes_hut_accelerations(positions, masses, theta, softening, G)
+
+
+def total_energy(velocities: np.ndarray, masses: np.ndarray, potentials: np.ndarray) -> float:
+    """Kinetic plus potential energy, E = Σ ½ m v² + ½ Σ m φ (each pair counted once)."""
+    kinetic = 0.5 * float(np.einsum("i,ij,ij->", masses, velocities, velocities))
+    return kinetic + 0.5 * float(masses @ potentials)
+
+
+def leapfrog(positions: np.ndarray, velocities: np.ndarray, masses: np.ndarray, dt: float, steps: int,
+             solver: str = "auto", theta: float = 0.5, softening: float = 0.0, G: float = G,
+             energy_every: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Kick-drift-kick leapfrog integration of an N-body system.
+    Returns (positions, velocities, drift) where drift holds the relative energy error (E - E₀) / |E₀|
+    sampled every `energy_every` steps (empty if energy_every is 0).
+    """
+    x = np.array(positions, dtype=np.float64)
+    v = np.array(velocities, dtype=np.float64)
+    masses = np.asarray(masses, dtype=np.float64)
+    a, phi = accelerations(x, masses, solver, theta, softening, G)
+    e0 = total_energy(v, masses, phi)
+    drift = []
+    for step in range(1, steps + 1):
+        v += 0.5 * dt * a
+        x += dt * v
+        a, phi = accelerations(x, masses, solver, theta, softening, G)
+        v += 0.5 * dt * a
+        if energy_every and step % energy_every == 0:
+            drift.append((total_energy(v, masses, phi) - e0) / abs(e0))
+    return x, v, np.array(drift)
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    n = 3000
+    pos = rng.normal(size=(n, 3))
+    vel = rng.normal(scale=0.3, size=(n, 3))
+    m = np.full(n, 1.0 / n)
+
+    exact, _ = direct_accelerations(pos, m, softening=0.01, G=1.0)
+    approx, _ = barnes_hut_accelerations(pos, m, theta=0.5, softening=0.01, G=1.0)
+    error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    print(f"Barnes–Hut (θ=0.5) median relative force error for {n} bodies: {np.median(error):.2e}")
+
+    _, _, drift = leapfrog(pos[:500], vel[:500], m[:500] * 6, dt=1e-3, steps=100, softening=0.05, G=1.0, energy_every=10)
+    print("Leapfrog relative energy drift:", drift)
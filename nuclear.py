@@ -5,44 +5,51 @@ Nuclear Physics Module
 Implements radioactive decay, nuclear reactions, mass defect, and nuclear energy.
 """
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from Physics.constants import SPEED_OF_LIGHT
+from Physics.precision import precise, exp
 
-getcontext().prec = 50
 
 LN2 = Decimal("0.6931471805599453")
 
 # Mass defect: Δm = (Z * m_p + N * m_n) - m_nucleus
+@precise
 def mass_defect(protons: Decimal, neutrons: Decimal, nucleus_mass: Decimal, proton_mass: Decimal, neutron_mass: Decimal) -> Decimal:
     """Calculate mass defect (kg)."""
     return (protons * proton_mass + neutrons * neutron_mass) - nucleus_mass
 
 # Nuclear binding energy: E = Δm * c²
+@precise
 def binding_energy(mass_defect: Decimal) -> Decimal:
     """Calculate binding energy (Joules)."""
     return mass_defect * SPEED_OF_LIGHT ** 2
 
 # Radioactive decay: N(t) = N₀ * e^(-λt)
+@precise
 def radioactive_decay(N0: Decimal, decay_constant: Decimal, time: Decimal) -> Decimal:
     """Calculate undecayed nuclei at time t."""
     exponent = -decay_constant * time
-    return N0 * exponent.exp()
+    return N0 * exp(exponent)
 
 # Half-life: T₁/₂ = ln(2) / λ
+@precise
 def half_life(decay_constant: Decimal) -> Decimal:
     return LN2 / decay_constant
 
 # Decay constant: λ = ln(2) / T₁/₂
+@precise
 def decay_constant_from_half_life(half_life: Decimal) -> Decimal:
     return LN2 / half_life
 
 # Fusion energy: E = Δm * c² (same as binding_energy)
+@precise
 def fusion_energy(initial_mass: Decimal, final_mass: Decimal) -> Decimal:
     """Energy released during nuclear fusion."""
     Δm = initial_mass - final_mass
     return Δm * SPEED_OF_LIGHT ** 2
 
 # Fission energy: use same function, just with mass loss during fission
+@precise
 def fission_energy(initial_mass: Decimal, fragment_masses: list[Decimal]) -> Decimal:
     """Energy released during nuclear fission."""
     final_mass = sum(fragment_masses)
@@ -5,14 +5,15 @@ Optics Module
 Implements physics of light, lenses, mirrors, reflection, and refraction.
 """
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from Physics.constants import SPEED_OF_LIGHT
+from Physics.precision import precise
 
-getcontext().prec = 50
 
 # Reflection: angle of incidence = angle of reflection (simple rule-based, no math needed)
 
 # Snell's Law: n1 * sin(θ1) = n2 * sin(θ2)
+@precise
 def snells_law(n1: Decimal, theta1_deg: Decimal, n2: Decimal) -> Decimal:
     """Calculate angle of refraction in degrees."""
     import math
@@ -24,11 +25,13 @@ def snells_law(n1: Decimal, theta1_deg: Decimal, n2: Decimal) -> Decimal:
     return Decimal(math.degrees(theta2_rad))
 
 # Lens & mirror equation: 1/f = 1/do + 1/di
+@precise
 def image_distance(focal_length: Decimal, object_distance: Decimal) -> Decimal:
     """Calculate image distance using lens/mirror equation."""
     return Decimal("1") / (Decimal("1") / focal_length - Decimal("1") / object_distance)
 
 # Magnification: m = -di / do (mirrors), m = +di / do (lenses)
+@precise
 def magnification(image_distance: Decimal, object_distance: Decimal, is_mirror: bool = False) -> Decimal:
     """Calculate magnification of image."""
     if is_mirror:
@@ -36,10 +39,12 @@ def magnification(image_distance: Decimal, object_distance: Decimal, is_mirror:
     return image_distance / object_distance
 
 # Speed of light in medium: v = c / n
+@precise
 def speed_in_medium(refractive_index: Decimal) -> Decimal:
     return SPEED_OF_LIGHT / refractive_index
 
 # Focal length from radius of curvature: f = R / 2
+@precise
 def focal_length_from_radius(radius_of_curvature: Decimal) -> Decimal:
     return radius_of_curvature / 2
 
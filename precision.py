@@ -0,0 +1,147 @@
+# Physics/precision.py
+
+"""
+Precision Policy Module
+Selects the arithmetic precision used by the Decimal formulas on a per-call basis.
+
+Policies:
+    "exact50"       50 significant digits (default, audit grade)
+    "fast-decimal"  16 significant digits (cheap Decimal arithmetic)
+    "float"         native float arithmetic: the formula runs with its Decimal constants as
+                    floats, so float and float64 ndarray arguments are evaluated directly
+
+The active policy lives in a ContextVar, so it is thread-local and asyncio-safe,
+and importing this package never touches the caller's global Decimal context.
+"""
+
+import math
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal, localcontext
+from functools import wraps
+from types import FunctionType
+from typing import Callable, Iterator, Optional
+
+POLICIES = {
+    "exact50": 50,
+    "fast-decimal": 16,
+    "float": None,      # no Decimal context: evaluated in float arithmetic
+}
+
+DEFAULT_POLICY = "exact50"
+
+_policy: ContextVar[str] = ContextVar("physics_precision_policy", default=DEFAULT_POLICY)
+_active: ContextVar[Optional[str]] = ContextVar("physics_precision_active", default=None)
+
+
+def _check(policy: str) -> str:
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown precision policy {policy!r}; expected one of {sorted(POLICIES)}")
+    return policy
+
+
+def current_policy() -> str:
+    """Return the precision policy active in the current thread / task."""
+    return _policy.get()
+
+
+@contextmanager
+def precision(policy: str) -> Iterator[str]:
+    """
+    Run a block under the given precision policy.
+    Example:
+        with precision("fast-decimal"):
+            relativity.lorentz_factor(v)
+    """
+    token = _policy.set(_check(policy))
+    try:
+        yield policy
+    finally:
+        _policy.reset(token)
+
+
+def _to_float(value):
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _float_twin(func: Callable) -> Callable:
+    """
+    Copy of func whose module globals and defaults have Decimal values replaced by floats, and
+    whose `Decimal(...)` calls build floats; the globals are snapshotted on the first float call.
+    """
+    namespace = {name: _to_float(value) for name, value in func.__globals__.items()}
+    namespace["Decimal"] = float
+    defaults = tuple(_to_float(v) for v in func.__defaults__) if func.__defaults__ else None
+    twin = FunctionType(func.__code__, namespace, func.__name__, defaults, func.__closure__)
+    if func.__kwdefaults__:
+        twin.__kwdefaults__ = {k: _to_float(v) for k, v in func.__kwdefaults__.items()}
+    return twin
+
+
+def precise(func: Callable) -> Callable:
+    """
+    Evaluate a Decimal formula under the active precision policy.
+    The wrapped function also accepts a `precision=` keyword overriding the policy for one call.
+    Nested calls between formulas run directly inside the outermost call's context (or float evaluation).
+    Formulas take roots and exponentials through this module's sqrt/exp so that they also run on floats.
+    """
+    twin = None
+
+    def evaluate_float(args, kwargs):
+        nonlocal twin
+        if twin is None:
+            twin = _float_twin(func)
+        return twin(*(_to_float(a) for a in args), **{k: _to_float(v) for k, v in kwargs.items()})
+
+    @wraps(func)
+    def wrapper(*args, precision: Optional[str] = None, **kwargs):
+        active = _active.get()
+        if precision is None and active is not None:
+            return evaluate_float(args, kwargs) if active == "float" else func(*args, **kwargs)
+        policy = _check(precision) if precision is not None else _policy.get()
+        token = _active.set(policy)
+        try:
+            if policy == "float":
+                return evaluate_float(args, kwargs)
+            with localcontext() as ctx:
+                ctx.prec = POLICIES[policy]
+                return func(*args, **kwargs)
+        finally:
+            _active.reset(token)
+    return wrapper
+
+
+def sqrt(value):
+    """Square root of a Decimal (in the active context), a float or a float64 ndarray."""
+    if isinstance(value, Decimal):
+        return value.sqrt()
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        return np.sqrt(value)
+    return math.sqrt(value)
+
+
+def exp(value):
+    """e**value for a Decimal (in the active context), a float or a float64 ndarray."""
+    if isinstance(value, Decimal):
+        return value.exp()
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        return np.exp(value)
+    return math.exp(value)
+
+
+# Example usage
+if __name__ == "__main__":
+    from decimal import getcontext
+
+    @precise
+    def third(x: Decimal) -> Decimal:
+        return x / 3
+
+    print("Policy:", current_policy(), "->", third(Decimal("1")))
+    with precision("fast-decimal"):
+        print("Policy:", current_policy(), "->", third(Decimal("1")))
+    print("Per-call float:", third(1.0, precision="float"))
+    print("Global context untouched:", getcontext().prec)
@@ -5,39 +5,45 @@ Quantum Physics Module
 Implements key quantum principles: quantization, uncertainty, wave-particle duality.
 """
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from Physics.constants import PLANCK_CONSTANT, SPEED_OF_LIGHT
+from Physics.precision import precise
 
-getcontext().prec = 50
 
 # Planck's relation: E = h * f
+@precise
 def energy_from_frequency(frequency: Decimal) -> Decimal:
     """Calculate photon energy (Joules) from frequency."""
     return PLANCK_CONSTANT * frequency
 
 # E = hc / λ
+@precise
 def energy_from_wavelength(wavelength: Decimal) -> Decimal:
     """Calculate photon energy (Joules) from wavelength (meters)."""
     return PLANCK_CONSTANT * SPEED_OF_LIGHT / wavelength
 
 # De Broglie wavelength: λ = h / p
+@precise
 def de_broglie_wavelength(mass: Decimal, velocity: Decimal) -> Decimal:
     """Calculate wavelength of a particle."""
     momentum = mass * velocity
     return PLANCK_CONSTANT / momentum
 
 # Heisenberg uncertainty principle: Δx * Δp ≥ ħ / 2
+@precise
 def uncertainty_position(momentum_uncertainty: Decimal) -> Decimal:
     """Estimate position uncertainty given Δp."""
     h_bar = PLANCK_CONSTANT / (Decimal("2") * Decimal("3.141592653589793"))
     return h_bar / (Decimal("2") * momentum_uncertainty)
 
+@precise
 def uncertainty_momentum(position_uncertainty: Decimal) -> Decimal:
     """Estimate momentum uncertainty given Δx."""
     h_bar = PLANCK_CONSTANT / (Decimal("2") * Decimal("3.141592653589793"))
     return h_bar / (Decimal("2") * position_uncertainty)
 
 # Energy levels of hydrogen: E_n = -13.6 eV / n² (converted to Joules)
+@precise
 def hydrogen_energy_level(n: int) -> Decimal:
     """Energy of electron at quantum level n in hydrogen atom (Joules)."""
     eV_to_Joule = Decimal("1.602176634e-19")
@@ -0,0 +1,226 @@
+# Physics/raytrace.py
+
+"""
+Ray Tracing Module
+Pushes whole batches of rays through a sequence of planar and spherical surfaces,
+the vector form of optics.snells_law applied to every ray at once.
+
+The optical axis is z. Each surface refracts (or reflects) in vector form
+    t = η d + (η cos θᵢ - sqrt(1 - η² sin² θᵢ)) n,   η = n₁ / n₂
+and total internal reflection is reported through a boolean mask instead of an exception.
+Rays that miss a surface, fall outside its aperture or undergo TIR (unless reflected)
+stop propagating; the result reports spot diagrams and per-surface throughput.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+SURFACE_MODES = ("refract", "reflect")
+TIR_POLICIES = ("drop", "reflect")
+
+
+@dataclass
+class PlaneSurface:
+    """Plane z = `z`; `n_after` is the refractive index behind it (ignored by mirrors)."""
+    z: float
+    n_after: float = 1.0
+    mode: str = "refract"
+    aperture: Optional[float] = None  # clear diameter; None = unbounded
+    name: str = ""
+
+
+@dataclass
+class SphericalSurface:
+    """
+    Sphere with vertex on the axis at z = `z` and signed radius (centre at z + radius):
+    radius > 0 is convex towards -z, radius < 0 concave towards -z.
+    """
+    z: float
+    radius: float
+    n_after: float = 1.0
+    mode: str = "refract"
+    aperture: Optional[float] = None
+    name: str = ""
+
+
+Surface = Union[PlaneSurface, SphericalSurface]
+
+
+@dataclass
+class SurfaceStats:
+    name: str
+    arrived: int      # rays alive when reaching the surface
+    missed: int       # no intersection, behind the ray, or outside the aperture
+    tir: int          # totally internally reflected (dropped or reflected according to the policy)
+
+
+@dataclass
+class TraceResult:
+    positions: np.ndarray             # (N, 3) last intersection of every ray
+    directions: np.ndarray            # (N, 3) unit directions after the last surface reached
+    alive: np.ndarray                 # (N,) rays that passed every surface
+    tir: np.ndarray                   # (N,) rays that hit total internal reflection anywhere
+    surfaces: List[SurfaceStats] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Fraction of launched rays that reached the end of the system."""
+        return float(self.alive.mean()) if len(self.alive) else 0.0
+
+    def spot(self) -> np.ndarray:
+        """Spot diagram: (x, y) of the surviving rays on the last surface, shape (M, 2)."""
+        return self.positions[self.alive, :2]
+
+    def spot_stats(self) -> dict:
+        """Centroid, RMS spot radius and geometric (maximum) radius of the spot diagram."""
+        spot = self.spot()
+        if not len(spot):
+            return {"rays": 0, "centroid": (np.nan, np.nan), "rms_radius": np.nan, "max_radius": np.nan}
+        centroid = spot.mean(axis=0)
+        r = np.linalg.norm(spot - centroid, axis=1)
+        return {"rays": len(spot), "centroid": (float(centroid[0]), float(centroid[1])),
+                "rms_radius": float(np.sqrt(np.mean(r * r))), "max_radius": float(r.max())}
+
+
+def refract(directions: np.ndarray, normals: np.ndarray, eta):
+    """
+    Vector Snell's law for unit directions and unit normals (any orientation) with η = n₁/n₂,
+    a scalar or one value per ray. Returns (new directions, tir mask); TIR rows keep their incoming direction.
+    """
+    eta = np.asarray(eta, dtype=np.float64)
+    cos_i = -np.einsum("ij,ij->i", directions, normals)
+    flip = cos_i < 0  # orient normals against the incoming rays
+    normals = np.where(flip[:, None], -normals, normals)
+    cos_i = np.abs(cos_i)
+    k = 1.0 - eta * eta * (1.0 - cos_i * cos_i)
+    tir = k < 0
+    out = eta[..., None] * directions + (eta * cos_i - np.sqrt(np.maximum(k, 0.0)))[:, None] * normals
+    out[tir] = directions[tir]
+    return out, tir
+
+
+def reflect(directions: np.ndarray, normals: np.ndarray) -> np.ndarray:
+    """Mirror reflection r = d - 2(d·n)n."""
+    return directions - 2.0 * np.einsum("ij,ij->i", directions, normals)[:, None] * normals
+
+
+def _intersect(surface, positions: np.ndarray, directions: np.ndarray):
+    """Ray parameter t and unit normals at the hit points; NaN t where the surface is missed."""
+    if isinstance(surface, PlaneSurface):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (surface.z - positions[:, 2]) / directions[:, 2]
+        normals = np.zeros_like(positions)
+        normals[:, 2] = 1.0
+        return t, normals
+    centre = np.array([0.0, 0.0, surface.z + surface.radius])
+    oc = positions - centre
+    b = np.einsum("ij,ij->i", directions, oc)
+    disc = b * b - (np.einsum("ij,ij->i", oc, oc) - surface.radius ** 2)
+    root = np.sqrt(np.where(disc >= 0, disc, np.nan))
+    near, far = -b - root, -b + root
+    # Of the two intersections, keep the one on the cap around the vertex
+    z_near = positions[:, 2] + near * directions[:, 2]
+    z_far = positions[:, 2] + far * directions[:, 2]
+    t = np.where(np.abs(z_near - surface.z) <= np.abs(z_far - surface.z), near, far)
+    hits = positions + t[:, None] * directions
+    normals = (hits - centre) / abs(surface.radius)
+    return t, normals
+
+
+def trace(positions, directions, surfaces: Sequence[Surface], n_initial: float = 1.0, on_tir: str = "drop") -> TraceResult:
+    """
+    Trace rays (N, 3 positions and directions; directions are normalized) through `surfaces` in order.
+    on_tir "drop" stops TIR rays (sequential design behaviour); "reflect" lets them continue reflected.
+    """
+    if on_tir not in TIR_POLICIES:
+        raise ValueError(f"on_tir must be one of {TIR_POLICIES}, not {on_tir!r}")
+    p = np.array(positions, dtype=np.float64)
+    d = np.array(directions, dtype=np.float64)
+    d /= np.linalg.norm(d, axis=1, keepdims=True)
+    n = len(p)
+    alive = np.ones(n, dtype=bool)
+    tir_any = np.zeros(n, dtype=bool)
+    stats = []
+    n_cur = np.full(n, float(n_initial))  # medium each ray travels in; TIR-reflected rays stay in theirs
+    for k, surface in enumerate(surfaces):
+        if surface.mode not in SURFACE_MODES:
+            raise ValueError(f"surface mode must be one of {SURFACE_MODES}, not {surface.mode!r}")
+        live = np.flatnonzero(alive)
+        arrived = len(live)
+        t, normals = _intersect(surface, p[live], d[live])
+        hits = p[live] + t[:, None] * d[live]
+        ok = np.isfinite(t) & (t > -1e-12)
+        if surface.aperture is not None:
+            ok &= np.hypot(hits[:, 0], hits[:, 1]) <= surface.aperture / 2
+        missed = int(np.count_nonzero(~ok))
+        alive[live[~ok]] = False
+        live, hits, normals = live[ok], hits[ok], normals[ok]
+        p[live] = hits
+        tir_count = 0
+        if surface.mode == "reflect":
+            d[live] = reflect(d[live], normals)
+        else:
+            new, tir = refract(d[live], normals, n_cur[live] / surface.n_after)
+            tir_count = int(np.count_nonzero(tir))
+            tir_any[live[tir]] = True
+            if on_tir == "reflect":
+                new[tir] = reflect(d[live[tir]], normals[tir])
+            else:
+                alive[live[tir]] = False
+            d[live] = new
+            n_cur[live[~tir]] = surface.n_after
+        stats.append(SurfaceStats(surface.name or f"surface {k}", arrived, missed, tir_count))
+    return TraceResult(p, d, alive, tir_any, stats)
+
+
+def collimated_beam(count: int, diameter: float, angle_deg: float = 0.0, z: float = 0.0,
+                    rng: Optional[np.random.Generator] = None):
+    """Rays uniformly filling a disc of `diameter` at z, tilted by `angle_deg` in the x–z plane."""
+    rng = np.random.default_rng() if rng is None else rng
+    r = diameter / 2 * np.sqrt(rng.random(count))
+    phi = 2 * np.pi * rng.random(count)
+    positions = np.column_stack((r * np.cos(phi), r * np.sin(phi), np.full(count, float(z))))
+    angle = np.radians(angle_deg)
+    directions = np.tile([np.sin(angle), 0.0, np.cos(angle)], (count, 1))
+    return positions, directions
+
+
+def point_source(count: int, position: Sequence[float], half_angle_deg: float,
+                 rng: Optional[np.random.Generator] = None):
+    """Rays from one point, uniform in solid angle within a cone of `half_angle_deg` about +z."""
+    rng = np.random.default_rng() if rng is None else rng
+    cos_max = np.cos(np.radians(half_angle_deg))
+    cos_t = 1.0 - rng.random(count) * (1.0 - cos_max)
+    sin_t = np.sqrt(1.0 - cos_t * cos_t)
+    phi = 2 * np.pi * rng.random(count)
+    directions = np.column_stack((sin_t * np.cos(phi), sin_t * np.sin(phi), cos_t))
+    return np.tile(np.asarray(position, dtype=np.float64), (count, 1)), directions
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from decimal import Decimal
+    from Physics.optics import focal_length_from_radius, snells_law
+
+    # One ray against the scalar Snell's law
+    angle = np.radians(30.0)
+    result = trace([[0.0, 0.0, 0.0]], [[np.sin(angle), 0.0, np.cos(angle)]], [PlaneSurface(1.0, 1.5)])
+    print("Refracted angle:", np.degrees(np.arcsin(result.directions[0, 0])), "vs optics.snells_law:",
+          snells_law(Decimal("1.0"), Decimal("30"), Decimal("1.5")))
+
+    # Glass-to-air exit beyond the critical angle is flagged, not raised
+    glass = trace(*point_source(1000, (0, 0, 0), 60.0, np.random.default_rng(1)), [PlaneSurface(1.0, 1.0)], n_initial=1.5)
+    print(f"Glass→air, 60° cone: {glass.tir.mean():.1%} TIR, throughput {glass.throughput:.1%}")
+
+    # Concave spherical mirror: paraxial focus at R/2 in front of the vertex
+    radius = -200.0
+    focus = 100.0 + float(focal_length_from_radius(Decimal(radius)))
+    rays = collimated_beam(1_000_000, 10.0, rng=np.random.default_rng(0))
+    start = time.perf_counter()
+    mirror = trace(*rays, [SphericalSurface(100.0, radius, mode="reflect", aperture=50.0, name="mirror"),
+                           PlaneSurface(focus, name="focal plane")])
+    print(f"10^6 rays in {time.perf_counter() - start:.2f} s; spot at z={focus}:", mirror.spot_stats())
+    print("Per-surface:", mirror.surfaces)
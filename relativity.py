@@ -4,41 +4,159 @@
 Relativity Module
 Implements Einstein's special relativity equations including time dilation,
 length contraction, and mass-energy equivalence.
+
+Lorentz boosts act on four-vectors ordered (ct, x, y, z) — events — or (E/c, px, py, pz) —
+four-momenta. Velocities with Decimal components use the exact path (nested tuples under the
+precision policy); float or plain int velocities give cached float64 matrices that transform
+whole (N, 4) arrays in one vectorized pass.
 """
 
-from decimal import Decimal, getcontext
+import sys
+from decimal import Decimal, localcontext
+from functools import lru_cache
+from typing import Sequence
 from Physics.constants import SPEED_OF_LIGHT
+from Physics.precision import precise, sqrt
+
+TRANSFORM_CHUNK = 1 << 20       # rows transformed per pass, bounding temporaries on huge arrays
 
-getcontext().prec = 50
 
+@precise
 def lorentz_factor(velocity: Decimal) -> Decimal:
-    """Calculate Lorentz factor: γ = 1 / sqrt(1 - v²/c²)"""
+    """Calculate Lorentz factor: γ = 1 / sqrt(1 - v²/c²) (an ndarray of speeds gives a float64 array)"""
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(velocity, np.ndarray):
+        inside = 1.0 - (np.asarray(velocity, dtype=np.float64) / float(SPEED_OF_LIGHT)) ** 2
+        if (inside <= 0).any():
+            raise ValueError("Velocity must be less than the speed of light")
+        return 1.0 / np.sqrt(inside)
     v2 = velocity ** 2
     c2 = SPEED_OF_LIGHT ** 2
     inside = Decimal("1") - (v2 / c2)
     if inside <= 0:
         raise ValueError("Velocity must be less than the speed of light")
-    return Decimal("1") / inside.sqrt()
+    return Decimal("1") / sqrt(inside)
 
+@precise
 def time_dilation(proper_time: Decimal, velocity: Decimal) -> Decimal:
     """Calculate dilated time: t = γ * t₀"""
     γ = lorentz_factor(velocity)
     return γ * proper_time
 
+@precise
 def length_contraction(proper_length: Decimal, velocity: Decimal) -> Decimal:
     """Calculate contracted length: L = L₀ / γ"""
     γ = lorentz_factor(velocity)
     return proper_length / γ
 
+@precise
 def relativistic_mass(rest_mass: Decimal, velocity: Decimal) -> Decimal:
     """Calculate relativistic mass: m = γ * m₀"""
     γ = lorentz_factor(velocity)
     return γ * rest_mass
 
+@precise
 def mass_energy_equivalence(mass: Decimal) -> Decimal:
     """Calculate energy using E = mc²"""
     return mass * (SPEED_OF_LIGHT ** 2)
 
+@precise
+def _decimal_boost_matrix(vx: Decimal, vy: Decimal, vz: Decimal):
+    v2 = vx * vx + vy * vy + vz * vz
+    γ = lorentz_factor(sqrt(v2))
+    β = [vx / SPEED_OF_LIGHT, vy / SPEED_OF_LIGHT, vz / SPEED_OF_LIGHT]
+    k = (γ - 1) * SPEED_OF_LIGHT ** 2 / v2 if v2 else Decimal(0)
+    rows = [[γ] + [-γ * b for b in β]]
+    for i in range(3):
+        rows.append([-γ * β[i]] + [(Decimal(1) if i == j else Decimal(0)) + k * β[i] * β[j] for j in range(3)])
+    return tuple(tuple(row) for row in rows)
+
+
+@lru_cache(maxsize=256)
+def _float_boost_matrix(vx: float, vy: float, vz: float):
+    import numpy as np
+    β = np.array([vx, vy, vz]) / float(SPEED_OF_LIGHT)
+    b2 = float(β @ β)
+    γ = float(lorentz_factor(np.array(b2 ** 0.5 * float(SPEED_OF_LIGHT))))
+    matrix = np.empty((4, 4))
+    matrix[0, 0] = γ
+    matrix[0, 1:] = matrix[1:, 0] = -γ * β
+    matrix[1:, 1:] = np.eye(3) + ((γ - 1) / b2 * np.outer(β, β) if b2 else 0.0)
+    matrix.setflags(write=False)  # shared by every caller through the cache
+    return matrix
+
+
+def boost_matrix(velocity: Sequence):
+    """
+    Λ for changing to a frame moving with `velocity` (vx, vy, vz in m/s):
+    Λ⁰₀ = γ, Λ⁰ᵢ = Λⁱ₀ = -γβᵢ, Λⁱⱼ = δᵢⱼ + (γ - 1)βᵢβⱼ/β².
+    Decimal components (ints alongside them count as exact) give an exact 4×4 tuple of tuples;
+    floats and plain ints give a cached read-only ndarray. Mixing Decimal and float raises ValueError.
+    """
+    if any(isinstance(v, Decimal) for v in velocity):
+        if not all(isinstance(v, (Decimal, int)) for v in velocity):
+            raise ValueError(f"velocity mixes Decimal and float components: {tuple(velocity)!r}")
+        return _decimal_boost_matrix(*(Decimal(v) for v in velocity))
+    return _float_boost_matrix(*(float(v) for v in velocity))
+
+
+@precise
+def _decimal_matmul(a, b):
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(4)) for j in range(len(b[0]))) for i in range(len(a)))
+
+
+def compose_boosts(*velocities: Sequence):
+    """
+    Single matrix for successive boosts (the first velocity applied first);
+    non-collinear boosts compose to a boost times a Wigner rotation.
+    Exact only if every boost is exact; otherwise all matrices are composed in float64.
+    """
+    matrices = [boost_matrix(v) for v in velocities]
+    if all(isinstance(m, tuple) for m in matrices):
+        result = matrices[0]
+        for m in matrices[1:]:
+            result = _decimal_matmul(m, result)
+        return result
+    import numpy as np
+    matrices = [np.array(m, dtype=np.float64) if isinstance(m, tuple) else m for m in matrices]
+    result = matrices[0]
+    for m in matrices[1:]:
+        result = m @ result
+    return result
+
+
+def transform(vectors, matrix, out=None):
+    """
+    Apply a Lorentz matrix to four-vectors: an (N, 4) array (float64, in chunks of TRANSFORM_CHUNK rows;
+    `out` may be the input itself), or a sequence of Decimal 4-tuples with an exact tuple matrix.
+    An exact matrix applied to an ndarray is converted to float64.
+    """
+    np = sys.modules.get("numpy")
+    if isinstance(matrix, tuple) and not (np is not None and isinstance(vectors, np.ndarray)):
+        return [tuple(column) for column in zip(*_decimal_matmul(matrix, tuple(zip(*vectors))))]
+    vectors = np.asarray(vectors, dtype=np.float64)
+    if out is None:
+        out = np.empty_like(vectors)
+    matrix_t = np.ascontiguousarray(np.asarray(matrix, dtype=np.float64).T)
+    for start in range(0, len(vectors), TRANSFORM_CHUNK):
+        rows = slice(start, start + TRANSFORM_CHUNK)
+        out[rows] = vectors[rows] @ matrix_t
+    return out
+
+
+def boost(vectors, velocity: Sequence, out=None):
+    """Boost four-vectors into the frame moving with `velocity` (see boost_matrix and transform)."""
+    return transform(vectors, boost_matrix(velocity), out)
+
+
+def interval(vectors):
+    """Invariant s² = (x⁰)² - |x|² of each four-vector (η = math_tools.minkowski_metric("+---"))."""
+    np = sys.modules.get("numpy")
+    if np is None or not isinstance(vectors, np.ndarray):
+        return [v[0] * v[0] - v[1] * v[1] - v[2] * v[2] - v[3] * v[3] for v in vectors]
+    from Physics.math_tools import minkowski_metric
+    return np.einsum("ni,ij,nj->n", vectors, minkowski_metric("+---").components, vectors)
+
 # Example usage
 if __name__ == "__main__":
     v = Decimal("299000000")  # m/s
@@ -48,3 +166,23 @@ if __name__ == "__main__":
     print("Time dilation at v=299,000,000 m/s:", time_dilation(t0, v), "s")
     print("Length contraction for 1m rod:", length_contraction(Decimal("1"), v), "m")
     print("Mass-energy of 1kg:", mass_energy_equivalence(Decimal("1")), "J")
+
+    # A clock ticking 1 s at rest, seen from a frame it moves through at +v: Decimal path vs time_dilation
+    c = SPEED_OF_LIGHT
+    (tick,) = boost([(c * t0, Decimal(0), Decimal(0), Decimal(0))], (-v, Decimal(0), Decimal(0)))
+    with localcontext() as ctx:
+        ctx.prec = 50
+        print("Boosted tick:", tick[0] / c, "s == time_dilation:", time_dilation(t0, v))
+
+    import time
+    import numpy as np
+    rng = np.random.default_rng(0)
+    events = rng.normal(size=(10_000_000, 4))
+    velocity = (1e8, -5e7, 2e7)
+    start = time.perf_counter()
+    boosted = boost(events, velocity)
+    elapsed = time.perf_counter() - start
+    print(f"Boosted 10^7 events in {elapsed:.2f} s; max interval change",
+          np.abs(interval(boosted[:1000]) - interval(events[:1000])).max())
+    there_and_back = compose_boosts(velocity, tuple(-x for x in velocity))
+    print("Boost then inverse boost is identity:", np.allclose(there_and_back, np.eye(4)))
@@ -5,10 +5,11 @@ Sound Physics Module
 Models the physics of real sound: waves, frequency, speed, and the Doppler effect.
 """
 
-from decimal import Decimal, getcontext
+import sys
+from decimal import Decimal
 from Physics.constants import STANDARD_GRAVITY
+from Physics.precision import precise
 
-getcontext().prec = 50
 
 # Speed of sound in various media (approximate, 20°C)
 SPEED_OF_SOUND_AIR = Decimal("343")         # m/s
@@ -16,24 +17,29 @@ SPEED_OF_SOUND_WATER = Decimal("1482")      # m/s
 SPEED_OF_SOUND_STEEL = Decimal("5960")      # m/s
 
 # Wave equation: v = f * λ
+@precise
 def wave_speed(frequency: Decimal, wavelength: Decimal) -> Decimal:
     """Calculate wave speed (m/s)."""
     return frequency * wavelength
 
+@precise
 def wavelength(speed: Decimal, frequency: Decimal) -> Decimal:
     """Calculate wavelength (m) from speed and frequency."""
     return speed / frequency
 
+@precise
 def frequency(speed: Decimal, wavelength: Decimal) -> Decimal:
     """Calculate frequency (Hz)."""
     return speed / wavelength
 
+@precise
 def period(frequency: Decimal) -> Decimal:
     """Calculate wave period (s)."""
     return Decimal("1") / frequency
 
 
 # Doppler effect for moving source and/or observer (air medium)
+@precise
 def doppler_effect(
     source_freq: Decimal,
     source_speed: Decimal,
@@ -50,13 +56,18 @@ def doppler_effect(
 
 
 # Sound Intensity: I = P / (4πr²)
+@precise
 def intensity(power: Decimal, distance: Decimal) -> Decimal:
-    """Calculate sound intensity (W/m²)."""
+    """Calculate sound intensity (W/m²); an ndarray of distances gives a float64 array."""
     pi = Decimal("3.141592653589793")
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(distance, np.ndarray):
+        return float(power) / (4 * float(pi) * np.asarray(distance, dtype=np.float64) ** 2)
     return power / (Decimal("4") * pi * (distance ** 2))
 
 
 # Sound Level in decibels: L = 10 * log10(I / I₀)
+@precise
 def sound_level_db(intensity: Decimal, ref_intensity: Decimal = Decimal("1e-12")) -> Decimal:
     """Calculate sound level in decibels (dB)."""
     from math import log10
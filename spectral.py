@@ -0,0 +1,186 @@
+# Physics/spectral.py
+
+"""
+Spectral Analysis Module
+Measures from recorded sample streams what waves and sound compute from known inputs:
+levels in dB (as sound.sound_level_db), dominant frequencies, and beats between close
+partials (as waves.beat_frequency).
+
+The STFT runs incrementally: samples arrive in chunks of any size, and each frame reuses
+the same preallocated frame, window and spectrum buffers, so per-frame latency is one FFT.
+"""
+
+from decimal import Decimal
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
+
+from Physics.waves import beat_frequency
+
+WINDOWS = ("hann", "hamming", "blackman", "rectangular")
+
+
+def window(name: str, size: int) -> np.ndarray:
+    """Periodic analysis window of the given size."""
+    if name not in WINDOWS:
+        raise ValueError(f"window must be one of {WINDOWS}, not {name!r}")
+    if name == "rectangular":
+        return np.ones(size)
+    phase = 2 * np.pi * np.arange(size) / size
+    if name == "hann":
+        return 0.5 - 0.5 * np.cos(phase)
+    if name == "hamming":
+        return 0.54 - 0.46 * np.cos(phase)
+    return 0.42 - 0.5 * np.cos(phase) + 0.08 * np.cos(2 * phase)
+
+
+def level_db(power, reference: float = 1e-12, floor: float = 1e-30) -> np.ndarray:
+    """Vectorized L = 10·log10(P / P₀), the array form of sound.sound_level_db (powers below `floor` are clamped)."""
+    return 10.0 * np.log10(np.maximum(np.asarray(power, dtype=np.float64), floor) / reference)
+
+
+class STFT:
+    """
+    Incremental short-time Fourier transform.
+
+    feed(chunk) yields one spectrum per completed frame (every `hop` samples once `frame_size`
+    samples have arrived). The yielded array is a reused buffer: consume or copy it before the
+    next frame. Spectra are scaled so a sinusoid of amplitude A peaks at about A.
+    """
+
+    def __init__(self, frame_size: int = 2048, hop: int = 512, sample_rate: int = 48000, window_name: str = "hann"):
+        if not 0 < hop <= frame_size:
+            raise ValueError("hop must satisfy 0 < hop <= frame_size")
+        self.frame_size = frame_size
+        self.hop = hop
+        self.sample_rate = sample_rate
+        self.window = window(window_name, frame_size)
+        self.scale = 2.0 / self.window.sum()
+        # Equivalent noise bandwidth in bins: one tone spreads its power over this many bins
+        self.enbw = frame_size * np.square(self.window).sum() / self.window.sum() ** 2
+        self.frequencies = np.fft.rfftfreq(frame_size, 1.0 / sample_rate)
+        self._buffer = np.zeros(frame_size)
+        self._windowed = np.empty(frame_size)
+        self._spectrum = np.empty(frame_size // 2 + 1, dtype=np.complex128)
+        self.reset()
+
+    def reset(self) -> None:
+        self._buffer[...] = 0.0
+        self._seen = 0                   # samples received in total
+        self._until_frame = self.frame_size
+        self.frames = 0
+
+    @property
+    def frame_rate(self) -> float:
+        return self.sample_rate / self.hop
+
+    def feed(self, chunk) -> Iterator[np.ndarray]:
+        """Push samples; yield the complex spectrum of each frame completed by them."""
+        chunk = np.asarray(chunk, dtype=np.float64)
+        buffer = self._buffer
+        while len(chunk):
+            take = min(self._until_frame, len(chunk))
+            if take >= self.frame_size:
+                buffer[...] = chunk[take - self.frame_size:take]
+            else:
+                buffer[:-take] = buffer[take:]
+                buffer[-take:] = chunk[:take]
+            chunk = chunk[take:]
+            self._seen += take
+            self._until_frame -= take
+            if self._until_frame == 0:
+                self._until_frame = self.hop
+                np.multiply(buffer, self.window, out=self._windowed)
+                np.fft.rfft(self._windowed, out=self._spectrum)
+                self._spectrum *= self.scale
+                self.frames += 1
+                yield self._spectrum
+
+    def spectrogram(self, chunks: Iterable) -> np.ndarray:
+        """Magnitude spectrogram (frames, bins) of a whole chunk stream."""
+        return np.array([np.abs(spectrum) for chunk in chunks for spectrum in self.feed(chunk)])
+
+    def levels(self, spectrogram: np.ndarray, reference: float = 1.0) -> np.ndarray:
+        """Per-frame level in dB of the summed sinusoidal power (A²/2 per partial) of a magnitude spectrogram."""
+        return level_db(0.5 * np.square(spectrogram).sum(axis=-1) / self.enbw, reference)
+
+
+def track_peaks(spectrogram: np.ndarray, frequencies: np.ndarray, count: int = 1,
+                threshold: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The `count` strongest local maxima of every frame, refined by parabolic interpolation on log magnitude.
+    Returns (frequencies, amplitudes), both (frames, count), strongest first; missing peaks are NaN.
+    """
+    mag = np.atleast_2d(np.asarray(spectrogram, dtype=np.float64))
+    frames = len(mag)
+    interior = mag[:, 1:-1]
+    is_peak = (interior > mag[:, :-2]) & (interior >= mag[:, 2:]) & (interior > threshold)
+    score = np.where(is_peak, interior, -np.inf)
+    count = min(count, score.shape[1])
+    top = np.argpartition(-score, count - 1, axis=1)[:, :count]
+    order = np.argsort(-np.take_along_axis(score, top, axis=1), axis=1)
+    bins = np.take_along_axis(top, order, axis=1) + 1
+    valid = np.isfinite(np.take_along_axis(score, bins - 1, axis=1))
+    log = np.log(np.maximum(mag, 1e-300))
+    rows = np.arange(frames)[:, None]
+    left, centre, right = log[rows, bins - 1], log[rows, bins], log[rows, bins + 1]
+    curvature = left - 2 * centre + right
+    usable = valid & (curvature < 0)
+    offset = np.where(usable, 0.5 * (left - right) / np.where(usable, curvature, -1.0), 0.0)
+    step = frequencies[1] - frequencies[0]
+    peak_freq = np.where(valid, frequencies[bins] + offset * step, np.nan)
+    peak_amp = np.where(valid, np.exp(centre - 0.25 * (left - right) * offset), np.nan)
+    return peak_freq, peak_amp
+
+
+def modulation_frequency(envelope: np.ndarray, rate: float, min_frequency: float = 0.2) -> float:
+    """Dominant modulation frequency (Hz) of an envelope sampled at `rate`, refined between FFT bins."""
+    envelope = np.asarray(envelope, dtype=np.float64)
+    spectrum = np.abs(np.fft.rfft((envelope - envelope.mean()) * window("hann", len(envelope))))
+    freqs = np.fft.rfftfreq(len(envelope), 1.0 / rate)
+    spectrum[freqs < min_frequency] = 0.0
+    k = int(spectrum[1:-1].argmax()) + 1
+    a, b, c = np.log(spectrum[k - 1:k + 2] + 1e-300)
+    offset = 0.5 * (a - c) / (a - 2 * b + c) if a - 2 * b + c < 0 else 0.0
+    return float((k + offset) * freqs[1])
+
+
+def detect_beats(spectrogram: np.ndarray, frame_rate: float, frequencies: np.ndarray,
+                 resolved_separation: float = None) -> float:
+    """
+    Beat frequency of a signal made of close partials.
+    If two partials are resolved in the averaged spectrum closer than `resolved_separation` Hz,
+    the beat is waves.beat_frequency of their frequencies; otherwise it is the dominant
+    modulation of the frame level (the partials sum into one peak whose loudness pulses).
+    """
+    if resolved_separation is not None:
+        freqs, _ = track_peaks(spectrogram.mean(axis=0), frequencies, count=2)
+        f1, f2 = freqs[0]
+        if np.isfinite(f2) and abs(f1 - f2) <= resolved_separation:
+            return float(beat_frequency(Decimal(repr(float(f1))), Decimal(repr(float(f2)))))
+    envelope = np.sqrt(np.square(spectrogram).sum(axis=-1))
+    return modulation_frequency(envelope, frame_rate)
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Physics.sound import sound_level_db
+
+    rate = 48000
+    t = np.arange(4 * rate) / rate
+    signal = 0.5 * np.sin(2 * np.pi * 440 * t) + 0.5 * np.sin(2 * np.pi * 443 * t) + 0.1 * np.sin(2 * np.pi * 2500 * t)
+    analyzer = STFT(frame_size=4096, hop=256, sample_rate=rate)
+    start = time.perf_counter()
+    spec = analyzer.spectrogram(signal[k:k + 1000] for k in range(0, len(signal), 1000))
+    elapsed = time.perf_counter() - start
+    print(f"{analyzer.frames} frames in {elapsed * 1e3:.1f} ms ({elapsed / analyzer.frames * 1e6:.0f} µs/frame)")
+
+    freqs, amps = track_peaks(spec, analyzer.frequencies, count=2)
+    print("Frame 100 peaks:", np.round(freqs[100], 1), "Hz, amplitudes", np.round(amps[100], 3))
+    print("Beat (3 Hz expected):", detect_beats(spec, analyzer.frame_rate, analyzer.frequencies))
+
+    tone = STFT(sample_rate=rate)
+    spectrum = np.abs(next(tone.feed(np.sin(2 * np.pi * 1000 * t[:2048]) * 1e-3)))
+    print("Level of a 1e-3 amplitude tone:", tone.levels(spectrum, 1e-12), "dB vs",
+          float(sound_level_db(Decimal("5e-7"))), "dB from sound.sound_level_db")
@@ -0,0 +1,82 @@
+# Physics/streaming.py
+
+"""
+Streaming Output Module
+Appends simulation output chunk by chunk to a memory-mapped `.npy` file, with
+periodic checkpoints so that a killed run can resume from its last saved state.
+"""
+
+import json
+import os
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class NpyStreamWriter:
+    """
+    Fixed-shape `.npy` file filled row-block by row-block through a memory map.
+
+    A checkpoint (`<path>.ckpt`, JSON) records how many rows are on disk together with
+    the caller's solver state and run parameters. Opening a writer on a path with a checkpoint
+    resumes it: `rows` and `state` are restored and appends continue after the last checkpointed
+    row. Resuming with different `params` raises ValueError instead of splicing two runs together.
+    """
+
+    def __init__(self, path: str, shape: Tuple[int, ...], dtype=np.float64, params: Optional[dict] = None):
+        self.path = path
+        self.checkpoint_path = path + ".ckpt"
+        # JSON round trip, so the comparison on resume sees exactly what was saved
+        self.params = json.loads(json.dumps(params or {}, default=str))
+        self.state: Optional[list] = None
+        self.rows = 0
+        if os.path.exists(self.checkpoint_path) and os.path.exists(path):
+            self.array = np.lib.format.open_memmap(path, mode="r+")
+            if self.array.shape != tuple(shape) or self.array.dtype != np.dtype(dtype):
+                raise ValueError(
+                    f"Cannot resume {path}: on disk {self.array.shape} {self.array.dtype}, "
+                    f"requested {tuple(shape)} {np.dtype(dtype)}"
+                )
+            with open(self.checkpoint_path) as f:
+                saved = json.load(f)
+            if saved.get("params", {}) != self.params:
+                raise ValueError(
+                    f"Cannot resume {path}: checkpoint was written with parameters {saved.get('params', {})}, "
+                    f"requested {self.params}; delete {self.checkpoint_path} to start over"
+                )
+            self.rows = saved["rows"]
+            self.state = saved["state"]
+        else:
+            self.array = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=tuple(shape))
+
+    @property
+    def resumed(self) -> bool:
+        return self.state is not None
+
+    @property
+    def complete(self) -> bool:
+        return self.rows == self.array.shape[0]
+
+    def append(self, chunk: np.ndarray) -> None:
+        """Write chunk after the rows already on disk."""
+        end = self.rows + len(chunk)
+        if end > self.array.shape[0]:
+            raise ValueError(f"Chunk overflows {self.path}: {end} > {self.array.shape[0]} rows")
+        self.array[self.rows:end] = chunk
+        self.rows = end
+
+    def checkpoint(self, state: Sequence[float]) -> None:
+        """Flush written rows to disk, then atomically record the row count, solver state and parameters."""
+        self.array.flush()
+        tmp = self.checkpoint_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"rows": self.rows, "state": [float(v) for v in state], "params": self.params}, f)
+        os.replace(tmp, self.checkpoint_path)
+
+    def close(self) -> np.ndarray:
+        """Flush, drop the checkpoint once every row is written, and return the data read-only."""
+        self.array.flush()
+        if self.complete and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        del self.array
+        return np.load(self.path, mmap_mode="r")
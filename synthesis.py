@@ -0,0 +1,222 @@
+# Physics/synthesis.py
+
+"""
+Signal Synthesis Module
+Renders sums of sinusoids y(t) = Σ Aₖ sin(2πfₖt + φₖ) block by block into float32/float64
+buffers, the array counterpart of waves.wave_function for audio-rate output.
+
+Each partial keeps a phase accumulator (in cycles, wrapped to [0, 1)), so blocks join
+seamlessly and long renders do not lose phase precision. Two renderers are available:
+    additive   direct evaluation of every partial, for any set of frequencies
+    wavetable  harmonic series only: one period is built with an inverse FFT and read back
+               with a phase accumulator and cubic interpolation, so the cost per sample
+               does not depend on the number of partials
+"""
+
+from decimal import Decimal
+from typing import Iterator, Optional
+
+import numpy as np
+
+from Physics.waves import beat_frequency, harmonic_frequency
+
+SYNTHESIS_METHODS = ("auto", "additive", "wavetable")
+WAVETABLE_MIN_PARTIALS = 16     # "auto" switches harmonic series to the wavetable above this
+_OVERSAMPLING = 64              # table samples per period of the highest harmonic
+_PARTIALS_PER_PASS = 64         # additive rows evaluated at once, bounding scratch memory
+
+
+def harmonic_series(fundamental: float, count: int, amplitudes=None, phases=None):
+    """
+    Frequencies, amplitudes and phases of the first `count` harmonics (via waves.harmonic_frequency).
+    Amplitudes default to 1/n (a sawtooth-like spectrum), phases to 0.
+    """
+    base = Decimal(str(fundamental))
+    frequencies = np.array([float(harmonic_frequency(base, n)) for n in range(1, count + 1)])
+    numbers = np.arange(1, count + 1)
+    amplitudes = 1.0 / numbers if amplitudes is None else np.broadcast_to(np.asarray(amplitudes, dtype=np.float64), (count,))
+    phases = np.zeros(count) if phases is None else np.broadcast_to(np.asarray(phases, dtype=np.float64), (count,))
+    return frequencies, np.asarray(amplitudes, dtype=np.float64), np.asarray(phases, dtype=np.float64)
+
+
+class Synthesizer:
+    """
+    Streaming oscillator bank producing fixed-size blocks of `block_size` samples.
+
+    render() fills and returns one reusable output buffer; copy it if you keep it.
+    Pass `fundamental` when all frequencies are integer multiples of it to allow the wavetable renderer.
+    """
+
+    def __init__(self, frequencies, amplitudes=1.0, phases=0.0, sample_rate: int = 48000, block_size: int = 1024,
+                 dtype=np.float32, method: str = "auto", fundamental: Optional[float] = None):
+        if method not in SYNTHESIS_METHODS:
+            raise ValueError(f"method must be one of {SYNTHESIS_METHODS}, not {method!r}")
+        self.frequencies = np.atleast_1d(np.asarray(frequencies, dtype=np.float64))
+        count = len(self.frequencies)
+        self.amplitudes = np.broadcast_to(np.asarray(amplitudes, dtype=np.float64), (count,)).copy()
+        self.phases = np.broadcast_to(np.asarray(phases, dtype=np.float64), (count,)).copy()
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.dtype = np.dtype(dtype)
+        self.fundamental = fundamental
+        harmonics = None
+        if fundamental is not None:
+            harmonics = np.rint(self.frequencies / fundamental).astype(np.int64)
+            if not np.allclose(harmonics * fundamental, self.frequencies, rtol=1e-12, atol=0.0) or (harmonics < 1).any():
+                raise ValueError("frequencies must be positive integer multiples of the fundamental")
+        if method == "auto":
+            method = "wavetable" if harmonics is not None and count >= WAVETABLE_MIN_PARTIALS else "additive"
+        if method == "wavetable" and harmonics is None:
+            raise ValueError("the wavetable method needs a fundamental")
+        self.method = method
+        self._ramp = np.arange(block_size, dtype=np.float64)
+        self._out = np.empty(block_size, dtype=self.dtype)
+        self._mix = np.zeros(block_size)
+        if method == "wavetable":
+            self._build_table(harmonics)
+            self._step = fundamental / sample_rate
+            self._scratch = [np.empty(block_size) for _ in range(4)]
+            self._index = np.empty(block_size, dtype=np.intp)
+        else:
+            self._steps = self.frequencies / sample_rate
+            rows = min(count, _PARTIALS_PER_PASS)
+            self._grid = np.empty((rows, block_size))
+        self.reset()
+
+    def _build_table(self, harmonics: np.ndarray) -> None:
+        """One period of the waveform via irfft, padded with wrap-around samples for 4-point interpolation."""
+        size = 1 << int(np.ceil(np.log2(max(1024, _OVERSAMPLING * int(harmonics.max())))))
+        spectrum = np.zeros(size // 2 + 1, dtype=np.complex128)
+        # A sin(2πkθ + φ) has irfft coefficient (N/2)·A·e^{i(φ - π/2)} at bin k
+        np.add.at(spectrum, harmonics, size / 2 * self.amplitudes * np.exp(1j * (self.phases - np.pi / 2)))
+        table = np.fft.irfft(spectrum, n=size)
+        self._table = np.concatenate((table[-1:], table, table[:2]))
+        self._table_size = size
+
+    def reset(self) -> None:
+        """Return every accumulator to its initial phase."""
+        if self.method == "wavetable":
+            self._phase = 0.0
+        else:
+            self._phase = np.mod(self.phases / (2 * np.pi), 1.0)
+        self.samples = 0
+
+    @property
+    def time(self) -> float:
+        return self.samples / self.sample_rate
+
+    def render(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Render the next block into `out` (or the internal buffer) and advance the accumulators."""
+        out = self._out if out is None else out
+        if self.method == "wavetable":
+            self._render_wavetable()
+        else:
+            self._render_additive()
+        out[...] = self._mix
+        self.samples += self.block_size
+        return out
+
+    def _render_additive(self) -> None:
+        mix, ramp = self._mix, self._ramp
+        mix[...] = 0.0
+        for start in range(0, len(self.frequencies), len(self._grid)):
+            stop = min(start + len(self._grid), len(self.frequencies))
+            grid = self._grid[:stop - start]
+            np.multiply(self._steps[start:stop, None], ramp, out=grid)
+            grid += self._phase[start:stop, None]
+            grid *= 2 * np.pi
+            np.sin(grid, out=grid)
+            mix += self.amplitudes[start:stop] @ grid
+        self._phase = np.mod(self._phase + self._steps * self.block_size, 1.0)
+
+    def _render_wavetable(self) -> None:
+        position, frac, w, tmp = self._scratch
+        index, table = self._index, self._table
+        np.multiply(self._ramp, self._step, out=position)
+        position += self._phase
+        np.mod(position, 1.0, out=position)
+        position *= self._table_size
+        np.floor(position, out=frac)
+        index[...] = frac
+        np.subtract(position, frac, out=frac)
+        index += 1  # padded table: sample i sits at i + 1
+        mix = self._mix
+        # Cubic Lagrange weights on the points i-1, i, i+1, i+2
+        np.multiply(frac, frac - 1, out=w)
+        np.multiply(w, frac - 2, out=w)
+        np.multiply(w, -1 / 6, out=w)
+        np.multiply(w, table[index - 1], out=mix)
+        np.multiply(frac + 1, frac - 1, out=w)
+        np.multiply(w, frac - 2, out=w)
+        np.multiply(w, 0.5, out=w)
+        np.multiply(w, table[index], out=tmp)
+        mix += tmp
+        np.multiply(frac + 1, frac, out=w)
+        np.multiply(w, frac - 2, out=w)
+        np.multiply(w, -0.5, out=w)
+        np.multiply(w, table[index + 1], out=tmp)
+        mix += tmp
+        np.multiply(frac + 1, frac, out=w)
+        np.multiply(w, frac - 1, out=w)
+        np.multiply(w, 1 / 6, out=w)
+        np.multiply(w, table[index + 2], out=tmp)
+        mix += tmp
+        self._phase = (self._phase + self._step * self.block_size) % 1.0
+
+    def blocks(self, count: Optional[int] = None) -> Iterator[np.ndarray]:
+        """Yield `count` consecutive blocks (forever if None); each yield reuses the same buffer."""
+        rendered = 0
+        while count is None or rendered < count:
+            yield self.render()
+            rendered += 1
+
+    def render_seconds(self, duration: float) -> np.ndarray:
+        """Render `duration` seconds (rounded up to whole blocks, then trimmed) into a new array."""
+        samples = int(round(duration * self.sample_rate))
+        count = -(-samples // self.block_size)
+        signal = np.empty(count * self.block_size, dtype=self.dtype)
+        for k in range(count):
+            self.render(signal[k * self.block_size:(k + 1) * self.block_size])
+        return signal[:samples]
+
+
+def harmonic_synthesizer(fundamental: float, count: int, amplitudes=None, phases=None, **options) -> Synthesizer:
+    """Synthesizer for the first `count` harmonics of `fundamental` (see harmonic_series)."""
+    frequencies, amplitudes, phases = harmonic_series(fundamental, count, amplitudes, phases)
+    return Synthesizer(frequencies, amplitudes, phases, fundamental=fundamental, **options)
+
+
+def beating_pair(f1: float, f2: float, amplitude: float = 0.5, **options) -> Synthesizer:
+    """
+    Two equal tones whose sum beats: sin a + sin b = 2 cos((a-b)/2) sin((a+b)/2),
+    so the loudness envelope repeats at waves.beat_frequency(f1, f2).
+    """
+    synth = Synthesizer([f1, f2], amplitude, **options)
+    synth.beat_frequency = float(beat_frequency(Decimal(str(f1)), Decimal(str(f2))))
+    return synth
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from Physics.waves import wave_function
+
+    tone = Synthesizer([440.0], 1.0, 0.3, dtype=np.float64)
+    block = tone.render()
+    t = Decimal(100) / Decimal(48000)
+    print("Sample 100:", block[100], "vs waves.wave_function:", wave_function(Decimal(1), Decimal(440), t, Decimal("0.3")))
+
+    saw_additive = harmonic_synthesizer(55.0, 400, method="additive", dtype=np.float64)
+    saw_table = harmonic_synthesizer(55.0, 400, dtype=np.float64)
+    for name, synth in (("additive", saw_additive), ("wavetable", saw_table)):
+        start = time.perf_counter()
+        signal = synth.render_seconds(1.0)
+        print(f"{name:9s}: 1 s of 400 harmonics in {time.perf_counter() - start:.3f} s")
+    saw_additive.reset()
+    saw_table.reset()
+    print("Wavetable max deviation:", np.abs(saw_table.render_seconds(1.0) - saw_additive.render_seconds(1.0)).max())
+
+    pair = beating_pair(440.0, 443.0)
+    envelope = np.abs(pair.render_seconds(1.0))
+    spectrum = np.abs(np.fft.rfft(envelope - envelope.mean()))  # 1 Hz bins over one second
+    print("Beat frequency:", pair.beat_frequency, "Hz; strongest envelope line:", spectrum[1:100].argmax() + 1, "Hz")
@@ -0,0 +1,195 @@
+# Physics/wave_equation.py
+
+"""
+Wave Equation Module
+Evolves strings (1D) and membranes (2D) under ∂²u/∂t² = c²∇²u with the explicit leapfrog
+finite-difference scheme, turning the closed-form standing-wave helpers of waves into a
+time-domain simulation that can be checked against them.
+
+The solver keeps two displacement buffers (current and previous) plus two scratch arrays,
+all allocated once; every step updates them in place and swaps the references, so a run
+over 10^6 cells allocates nothing per step.
+
+Boundaries are "fixed" (u = 0, a node of the standing wave) or "free" (∂u/∂n = 0, an antinode),
+per side. Grids are vertex-centred: n points span a length L with spacing L / (n - 1).
+"""
+
+from decimal import Decimal
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from Physics.spectral import track_peaks, window
+from Physics.waves import harmonic_frequency, standing_wave_length
+
+BOUNDARIES = ("fixed", "free")
+CFL_SAFETY = 0.9                 # default dt as a fraction of the stability limit h / (c √d)
+
+
+class WaveSolver:
+    """
+    Leapfrog solver on a 1D or 2D grid.
+    `boundary` is one name for every side, or one per side: (axis-0 start, axis-0 end, axis-1 start, axis-1 end).
+    `speed` may be a scalar or an array over the grid (heterogeneous media).
+    """
+
+    def __init__(self, shape: Union[int, Sequence[int]], spacing: Union[float, Sequence[float]], speed=1.0,
+                 dt: Optional[float] = None, boundary: Union[str, Sequence[str]] = "fixed"):
+        self.shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        self.ndim = len(self.shape)
+        if self.ndim not in (1, 2) or min(self.shape) < 3:
+            raise ValueError(f"grid must be 1D or 2D with at least 3 points per axis, got {self.shape}")
+        self.spacing = tuple(float(h) for h in np.broadcast_to(spacing, (self.ndim,)))
+        self.boundary = (boundary,) * 2 * self.ndim if isinstance(boundary, str) else tuple(boundary)
+        if len(self.boundary) != 2 * self.ndim or any(b not in BOUNDARIES for b in self.boundary):
+            raise ValueError(f"boundary must be one of {BOUNDARIES} or one per side ({2 * self.ndim} names)")
+        speed = np.asarray(speed, dtype=np.float64)
+        limit = min(self.spacing) / (float(speed.max()) * np.sqrt(self.ndim))
+        self.dt = CFL_SAFETY * limit if dt is None else float(dt)
+        if self.dt > limit:
+            raise ValueError(f"dt = {self.dt:g} exceeds the CFL stability limit {limit:g}")
+        # Courant numbers (c·dt/h)² per axis, scalars or grid-shaped
+        self._courant = [np.square(speed * self.dt / h) for h in self.spacing]
+        self.u = np.zeros(self.shape)
+        self.previous = np.zeros(self.shape)
+        self._accel = np.zeros(self.shape)
+        self._scratch = np.zeros(self.shape)
+        self._fixed = [self._face(axis, end) for axis in range(self.ndim) for end in (0, -1)
+                       if self.boundary[2 * axis + (end != 0)] == "fixed"]
+        self.time = 0.0
+        self.steps = 0
+
+    def _face(self, axis: int, index: int) -> Tuple:
+        face = [slice(None)] * self.ndim
+        face[axis] = index
+        return tuple(face)
+
+    def _accelerate(self, u: np.ndarray) -> np.ndarray:
+        """Fill the scratch buffer with dt²·c²∇²u (discrete, boundary-aware), in place."""
+        accel, tmp = self._accel, self._scratch
+        for axis in range(self.ndim):
+            mid, lo, hi = (self._face(axis, s) for s in (slice(1, -1), slice(None, -2), slice(2, None)))
+            np.add(u[lo], u[hi], out=tmp[mid])
+            np.subtract(tmp[mid], u[mid], out=tmp[mid])
+            np.subtract(tmp[mid], u[mid], out=tmp[mid])
+            for end, inner in ((slice(0, 1), slice(1, 2)), (slice(-1, None), slice(-2, -1))):
+                edge = self._face(axis, end)
+                # Free side: mirror ghost point u[-1] = u[1] gives 2(u[1] - u[0]); fixed sides are reset to 0 later
+                np.subtract(u[self._face(axis, inner)], u[edge], out=tmp[edge])
+                np.multiply(tmp[edge], 2.0, out=tmp[edge])
+            np.multiply(tmp, self._courant[axis], out=tmp)
+            if axis == 0:
+                accel[...] = tmp
+            else:
+                accel += tmp
+        return accel
+
+    def set_initial(self, displacement, velocity=None) -> None:
+        """Start from u(0) and ∂u/∂t(0); u(-dt) comes from a second-order Taylor step."""
+        self.u[...] = displacement
+        for face in self._fixed:
+            self.u[face] = 0.0
+        accel = self._accelerate(self.u)
+        np.multiply(accel, 0.5, out=self.previous)
+        self.previous += self.u
+        if velocity is not None:
+            self.previous -= self.dt * np.asarray(velocity, dtype=np.float64)
+        for face in self._fixed:
+            self.previous[face] = 0.0
+        self.time = 0.0
+        self.steps = 0
+
+    def step(self) -> None:
+        """Advance one time step: u⁺ = 2u - u⁻ + dt²c²∇²u, written over u⁻ and swapped in."""
+        u, new = self.u, self.previous
+        accel = self._accelerate(u)
+        np.subtract(u, new, out=new)
+        new += u
+        new += accel
+        for face in self._fixed:
+            new[face] = 0.0
+        self.u, self.previous = new, u
+        self.time += self.dt
+        self.steps += 1
+
+    def run(self, steps: int, probe=None) -> np.ndarray:
+        """
+        Take `steps` steps. With `probe` (an index tuple into the grid, e.g. (i,) or (i, j)),
+        returns the probe's displacement after every step as a (steps,) array.
+        """
+        series = np.empty(steps if probe is not None else 0)
+        for k in range(steps):
+            self.step()
+            if probe is not None:
+                series[k] = self.u[probe]
+        return series
+
+    def energy(self) -> float:
+        """
+        Discrete energy ½Σ(u̇² + c²∇u·∇u⁻) per unit density and cell, with the potential term taken
+        across the two time levels; for fixed ends this is exactly conserved by leapfrog.
+        """
+        velocity = (self.u - self.previous) / self.dt
+        potential = sum(float((np.diff(self.u, axis=axis) * np.diff(self.previous, axis=axis)
+                               * self._edge_courant(axis)).sum())
+                        for axis in range(self.ndim)) / self.dt ** 2
+        return 0.5 * float((velocity ** 2).sum()) + 0.5 * potential
+
+    def _edge_courant(self, axis: int):
+        courant = self._courant[axis]
+        if np.ndim(courant) == 0:
+            return courant
+        return 0.5 * (courant[self._face(axis, slice(1, None))] + courant[self._face(axis, slice(None, -1))])
+
+
+def mode_frequencies(series: np.ndarray, dt: float, count: int, threshold: float = 1e-2) -> np.ndarray:
+    """
+    The `count` lowest resonances (Hz) in a probe time series, refined between FFT bins.
+    Peaks weaker than `threshold` times the strongest one are ignored as leakage.
+    """
+    series = np.asarray(series, dtype=np.float64)
+    spectrum = np.abs(np.fft.rfft((series - series.mean()) * window("hann", len(series))))
+    freqs, amps = track_peaks(spectrum, np.fft.rfftfreq(len(series), dt), count=len(spectrum) // 2)
+    found = np.isfinite(amps[0])
+    freqs, amps = freqs[0][found], amps[0][found]
+    return np.sort(freqs[amps >= threshold * amps.max()])[:count]
+
+
+def string_harmonics(length: float, speed: float, count: int, fixed_ends: bool = True) -> np.ndarray:
+    """
+    Standing-wave frequencies f = c / λₙ of a string or pipe, with λₙ from waves.standing_wave_length
+    (both ends alike: λ = 2L/n; one fixed and one free end: λ = 4L/(2n - 1)).
+    """
+    length, speed = Decimal(repr(float(length))), Decimal(repr(float(speed)))
+    return np.array([float(speed / standing_wave_length(length, n, fixed_ends)) for n in range(1, count + 1)])
+
+
+def membrane_frequencies(lx: float, ly: float, speed: float, count: int) -> np.ndarray:
+    """Lowest `count` modes of a fixed rectangular membrane, f = (c/2)·sqrt((m/Lx)² + (n/Ly)²)."""
+    m, n = np.meshgrid(np.arange(1, count + 1), np.arange(1, count + 1))
+    return np.sort((0.5 * speed * np.hypot(m / lx, n / ly)).ravel())[:count]
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    length, speed, points = 1.0, 340.0, 401
+    x = np.linspace(0.0, length, points)
+    for ends, fixed_ends in ((("fixed", "fixed"), True), (("free", "free"), True), (("fixed", "free"), False)):
+        string = WaveSolver(points, length / (points - 1), speed, boundary=ends)
+        string.set_initial(np.exp(-((x - 0.23) / 0.02) ** 2))  # off-centre pluck excites every mode
+        series = string.run(40000, probe=(37,))
+        measured = mode_frequencies(series, string.dt, 4)
+        print(f"{ends[0]}-{ends[1]}: measured {np.round(measured, 1)} Hz, "
+              f"expected {np.round(string_harmonics(length, speed, 4, fixed_ends), 1)} Hz")
+    print("harmonic_frequency check (fixed-fixed n=3):", harmonic_frequency(Decimal(speed / (2 * length)), 3), "Hz")
+
+    membrane = WaveSolver((1000, 1000), 1e-3, 1.0)
+    g = np.linspace(0.0, 1.0, 1000)
+    membrane.set_initial(np.exp(-((g[:, None] - 0.3) ** 2 + (g[None, :] - 0.6) ** 2) / 0.001))
+    e0 = membrane.energy()
+    start = time.perf_counter()
+    membrane.run(50)
+    elapsed = time.perf_counter() - start
+    print(f"10^6-cell membrane: {elapsed / 50 * 1e3:.1f} ms/step, relative energy change {membrane.energy() / e0 - 1:.1e}")
@@ -5,30 +5,34 @@ General Wave Physics Module
 Covers the base properties of waves: harmonic motion, interference, and wave behavior.
 """
 
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from math import sin, pi
+from Physics.precision import precise
 
-getcontext().prec = 50
 
 # Wave equation: v = f * λ (reused from sound.py if needed)
 
+@precise
 def wave_function(amplitude: Decimal, frequency: Decimal, time: Decimal, phase: Decimal = Decimal("0")) -> Decimal:
     """
     Basic wave function: y(t) = A * sin(2πft + φ)
     """
-    return amplitude * Decimal(sin(float(2 * pi * frequency * time + phase)))
+    return amplitude * Decimal(sin(2 * pi * float(frequency * time) + float(phase)))
 
 
+@precise
 def angular_frequency(frequency: Decimal) -> Decimal:
     """ω = 2πf"""
     return Decimal("2") * Decimal(pi) * frequency
 
 
+@precise
 def harmonic_frequency(fundamental_freq: Decimal, harmonic_number: int) -> Decimal:
     """Calculate frequency of nth harmonic."""
     return fundamental_freq * Decimal(harmonic_number)
 
 
+@precise
 def standing_wave_length(length: Decimal, harmonic_number: int, fixed_ends: bool = True) -> Decimal:
     """
     Standing wave wavelength based on harmonic number.
@@ -41,16 +45,19 @@ def standing_wave_length(length: Decimal, harmonic_number: int, fixed_ends: bool
         return Decimal("4") * length / Decimal(2 * harmonic_number - 1)
 
 
+@precise
 def superposition(wave1: Decimal, wave2: Decimal) -> Decimal:
     """Add two wave amplitudes (constructive/destructive interference)."""
     return wave1 + wave2
 
 
+@precise
 def beat_frequency(f1: Decimal, f2: Decimal) -> Decimal:
     """Calculate beat frequency: |f1 - f2|"""
     return abs(f1 - f2)
 
 
+@precise
 def reflection_phase_change(fixed_end: bool) -> str:
     """
     Describes phase change due to reflection.